@@ -43,6 +43,27 @@ def _run_command_buffered(
     )
 
 
+def _run_command_uncaptured(
+    args: list[str],
+    *,
+    check: bool,
+    env: dict[str, str],
+    cwd: Optional[Path],
+) -> CommandResult:
+    """Run a subprocess whose output the caller never inspects.
+
+    The child writes straight to the inherited stdout/stderr, so no pipes are
+    read and nothing is decoded; the result carries only the exit status.
+    """
+    process = subprocess.run(
+        args,
+        env=env,
+        cwd=str(cwd) if cwd else None,
+        check=check,
+    )
+    return CommandResult(returncode=process.returncode, stdout="", stderr="")
+
+
 def _stream_pipe(pipe, collector: list[str], target=None) -> None:
     """Collect text from a pipe, optionally forwarding to a stream.
 
@@ -123,11 +144,12 @@ def _run_command_streaming(
     )
 
 
-def run_command(
+def run_command(  # pylint: disable=too-many-arguments
     args: Iterable[str],
     *,
     check: bool = False,
     live: bool = False,
+    capture_output: bool = True,
     env: Optional[dict[str, str]] = None,
     cwd: Optional[Path] = None,
 ) -> CommandResult:
@@ -137,6 +159,8 @@ def run_command(
         args: Command and arguments to execute
         check: If True, raise CalledProcessError on non-zero exit
         live: If True, stream output to stdout/stderr while capturing
+        capture_output: If False, leave output on the inherited streams and
+            return empty stdout/stderr; for callers that only need the exit status
         env: Additional environment variables to merge with os.environ
         cwd: Working directory for the command (defaults to current directory)
 
@@ -147,7 +171,12 @@ def run_command(
     if env:
         merged_env.update(env)
     command_args = list(args)
-    runner = _run_command_streaming if live else _run_command_buffered
+    if not capture_output:
+        runner = _run_command_uncaptured
+    elif live:
+        runner = _run_command_streaming
+    else:
+        runner = _run_command_buffered
     return runner(
         command_args,
         check=check,
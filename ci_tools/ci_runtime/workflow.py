@@ -101,7 +101,7 @@ def _stage_if_needed(options: RuntimeOptions, staged_diff: str) -> str:
     if not options.auto_stage_enabled:
         return staged_diff
     print("[info] Staging all changes (`git add -A`).")
-    run_command(["git", "add", "-A"], check=True)
+    run_command(["git", "add", "-A"], check=True, capture_output=False)
     return gather_git_diff(staged=True)
 
 
@@ -37,16 +37,9 @@ def get_class_line_span(node: ast.ClassDef) -> tuple[int, int]:
     Returns:
         Tuple of (start_line, end_line)
     """
-    start = getattr(node, "lineno", 0)
-    end = getattr(node, "end_lineno", None)
-    if end is None:
-        # Fallback: walk all child nodes to find maximum line number
-        end = start
-        for inner in ast.walk(node):
-            inner_end = getattr(inner, "end_lineno", None)
-            if inner_end is not None and inner_end > end:
-                end = inner_end
-    return start, end
+    # ast.parse always sets end_lineno on statements (Python 3.8+).
+    assert node.end_lineno is not None
+    return node.lineno, node.end_lineno
 
 
 def count_class_methods(node: ast.ClassDef) -> tuple[int, int]:
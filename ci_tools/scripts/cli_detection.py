@@ -12,7 +12,7 @@ rather than imported. It recognizes two common patterns:
 import ast
 from pathlib import Path
 
-from ci_tools.scripts.guard_common import iter_ast_nodes, parse_python_ast
+from ci_tools.scripts.import_analysis import load_module_ast, read_source
 
 
 def is_main_guard_node(node: ast.If) -> bool:
@@ -29,22 +29,6 @@ def is_main_guard_node(node: ast.If) -> bool:
     return isinstance(comparator, ast.Constant) and comparator.value == "__main__"
 
 
-def has_main_function(tree: ast.AST) -> bool:
-    """Check if AST contains a main() function definition."""
-    return any(
-        isinstance(node, ast.FunctionDef) and node.name == "main"
-        for node in iter_ast_nodes(tree, ast.FunctionDef)
-    )
-
-
-def has_main_guard(tree: ast.AST) -> bool:
-    """Check if AST contains if __name__ == '__main__' pattern."""
-    return any(
-        isinstance(node, ast.If) and is_main_guard_node(node)
-        for node in iter_ast_nodes(tree, ast.If)
-    )
-
-
 def calls_class_main(node: ast.AST) -> bool:
     """
     Check if a node calls ClassName.main() pattern.
@@ -71,22 +55,24 @@ def calls_class_main(node: ast.AST) -> bool:
     return False
 
 
-def has_class_main_call(tree: ast.AST) -> bool:
+def has_entry_point_pattern(tree: ast.AST) -> bool:
     """
-    Check if __main__ guard calls ClassName.main().
+    Check both entry point patterns in a single walk of the tree.
 
-    Returns True if the file has a __main__ guard that calls a class method main().
+    Matches a ``__main__`` guard together with a ``main()`` function anywhere in
+    the module, or a guard that calls ``*.main()``; the walk visits each node
+    once and stops at the first guard that calls ``*.main()``.
     """
-    for node in iter_ast_nodes(tree, ast.If):
-        if not isinstance(node, ast.If):
-            continue
-        if not is_main_guard_node(node):
-            continue
-        # Check if any statement in the if body calls *.main()
-        for stmt in node.body:
-            if calls_class_main(stmt):
+    found_main_function = False
+    found_main_guard = False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef):
+            found_main_function = found_main_function or node.name == "main"
+        elif isinstance(node, ast.If) and is_main_guard_node(node):
+            if any(calls_class_main(stmt) for stmt in node.body):
                 return True
-    return False
+            found_main_guard = True
+    return found_main_guard and found_main_function
 
 
 def is_cli_entry_point(py_file: Path) -> bool:
@@ -100,16 +86,11 @@ def is_cli_entry_point(py_file: Path) -> bool:
     CLI entry points are meant to be executed directly (e.g., python -m module)
     rather than imported, so they don't need to appear in import statements.
     """
-    tree = parse_python_ast(py_file, raise_on_error=False)
+    source = read_source(py_file)
+    # Both patterns need an `if __name__ == "__main__"` guard.
+    if source is None or b"__main__" not in source:
+        return False
+    tree = load_module_ast(py_file, source)
     if tree is None:
         return False
-
-    # Pattern 1: Module-level main() function
-    if has_main_guard(tree) and has_main_function(tree):
-        return True
-
-    # Pattern 2: Class-based ClassName.main() call
-    if has_class_main_call(tree):
-        return True
-
-    return False
+    return has_entry_point_pattern(tree)
@@ -13,11 +13,25 @@ Usage:
 
 import argparse
 import ast
+import functools
+import hashlib
+import itertools
 import sys
+from operator import attrgetter
 from pathlib import Path
 from typing import NamedTuple
 
-from radon.complexity import cc_visit
+from radon import __version__ as radon_version
+from radon.complexity import cc_visit_ast
+
+from ci_tools.scripts.guard_common import (
+    ResultsCache,
+    iter_python_files,
+    map_files_parallel,
+)
+
+# Bump when scoring or the violation fields change so cached results are rescanned.
+SCORING_VERSION = 1
 
 
 class ComplexityViolation(NamedTuple):
@@ -31,63 +45,57 @@ class ComplexityViolation(NamedTuple):
     violation_type: str
 
 
+# Control-flow nodes that add 1 plus their nesting depth and nest their children.
+_NESTING_NODE_TYPES = frozenset({ast.If, ast.While, ast.For, ast.ExceptHandler})
+
+
 def calculate_cognitive_complexity(node: ast.FunctionDef) -> int:
     """
     Calculate cognitive complexity for a function.
 
     Cognitive complexity measures how difficult code is to understand,
     accounting for nested control structures and logical operators.
+    The tree is walked with an explicit stack of (node, nesting level) pairs,
+    so no visitor method lookup happens per node.
     """
-
-    class CognitiveComplexityVisitor(ast.NodeVisitor):
-        """AST visitor that calculates cognitive complexity of a function."""
-
-        def __init__(self):
-            self.complexity = 0
-            self.nesting_level = 0
-
-        def visit_If(self, node):  # pylint: disable=invalid-name
-            """Visit If node and increment complexity based on nesting level."""
-            self.complexity += 1 + self.nesting_level
-            self.nesting_level += 1
-            self.generic_visit(node)
-            self.nesting_level -= 1
-
-        def visit_While(self, node):  # pylint: disable=invalid-name
-            """Visit While node and increment complexity based on nesting level."""
-            self.complexity += 1 + self.nesting_level
-            self.nesting_level += 1
-            self.generic_visit(node)
-            self.nesting_level -= 1
-
-        def visit_For(self, node):  # pylint: disable=invalid-name
-            """Visit For node and increment complexity based on nesting level."""
-            self.complexity += 1 + self.nesting_level
-            self.nesting_level += 1
-            self.generic_visit(node)
-            self.nesting_level -= 1
-
-        def visit_ExceptHandler(self, node):  # pylint: disable=invalid-name
-            """Visit ExceptHandler node and increment complexity based on nesting level."""
-            self.complexity += 1 + self.nesting_level
-            self.nesting_level += 1
-            self.generic_visit(node)
-            self.nesting_level -= 1
-
-        def visit_BoolOp(self, node):  # pylint: disable=invalid-name
-            """Visit BoolOp node and add complexity for each boolean condition."""
+    complexity = 0
+    pending: list[tuple[ast.AST, int]] = [(node, 0)]
+    while pending:
+        current, nesting = pending.pop()
+        node_type = type(current)
+        if node_type is ast.Lambda:
+            # Lambdas are separate cognitive units and are not counted.
+            continue
+        if node_type in _NESTING_NODE_TYPES:
+            complexity += 1 + nesting
+            nesting += 1
+        elif isinstance(current, ast.BoolOp):
             # Each additional condition in a boolean expression adds complexity
-            if isinstance(node.op, (ast.And, ast.Or)):
-                self.complexity += len(node.values) - 1
-            self.generic_visit(node)
+            complexity += len(current.values) - 1
+        pending.extend((child, nesting) for child in ast.iter_child_nodes(current))
+    return complexity
 
-        def visit_Lambda(self, node):  # pylint: disable=invalid-name
-            """Visit Lambda node without counting nested lambdas as they're separate units."""
-            # Don't count nested lambdas - they're separate cognitive units
 
-    visitor = CognitiveComplexityVisitor()
-    visitor.visit(node)
-    return visitor.complexity
+_FUNCTION_NODE_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def _collect_function_nodes(tree: ast.AST) -> dict[tuple[str, int], ast.AST]:
+    """Map ``(name, line)`` to each function that is not nested in another function.
+
+    Radon reports module-level functions and methods, never closures, so the
+    walk stops at each function instead of re-entering its body; the cognitive
+    walk covers that body once. Names alone collide for methods such as
+    ``__init__`` or ``run``, hence the line in the key.
+    """
+    function_nodes: dict[tuple[str, int], ast.AST] = {}
+    pending: list[ast.AST] = [tree]
+    while pending:
+        current = pending.pop()
+        if isinstance(current, _FUNCTION_NODE_TYPES):
+            function_nodes[(current.name, current.lineno)] = current
+        else:
+            pending.extend(ast.iter_child_nodes(current))
+    return function_nodes
 
 
 def check_file_complexity(  # pylint: disable=too-many-locals
@@ -95,22 +103,18 @@ def check_file_complexity(  # pylint: disable=too-many-locals
 ) -> list[ComplexityViolation]:
     """Check complexity for all functions in a file."""
     violations = []
+    # Built once so every violation in this file shares the same string.
+    file_key = str(file_path)
 
     try:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-
-        # Get cyclomatic complexity using radon
-        cyclomatic_results = cc_visit(content)
+        # ast.parse decodes the bytes itself, honouring any PEP 263 coding cookie;
+        # undecodable source surfaces as a SyntaxError.
+        content = file_path.read_bytes()
 
-        # Parse AST for cognitive complexity
-        tree = ast.parse(content)
-
-        # Build map of function names to AST nodes
-        function_nodes = {}
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                function_nodes[node.name] = node
+        # Parse once; radon's cyclomatic visitor and the cognitive visitor share the tree
+        tree = ast.parse(content, filename=file_key)
+        cyclomatic_results = cc_visit_ast(tree)
+        function_nodes = _collect_function_nodes(tree)
 
         # Check each function
         for result in cyclomatic_results:
@@ -120,10 +124,9 @@ def check_file_complexity(  # pylint: disable=too-many-locals
 
             # Calculate cognitive complexity
             cognitive = 0
-            if function_name in function_nodes:
-                cognitive = calculate_cognitive_complexity(
-                    function_nodes[function_name]
-                )
+            function_key = (function_name, line_number)
+            if function_key in function_nodes:
+                cognitive = calculate_cognitive_complexity(function_nodes[function_key])
 
             # Determine violations
             violation_types = []
@@ -135,7 +138,7 @@ def check_file_complexity(  # pylint: disable=too-many-locals
             if violation_types:
                 violations.append(
                     ComplexityViolation(
-                        file_path=str(file_path),
+                        file_path=file_key,
                         function_name=function_name,
                         line_number=line_number,
                         cyclomatic=cyclomatic,
@@ -144,12 +147,72 @@ def check_file_complexity(  # pylint: disable=too-many-locals
                     )
                 )
 
-    except (SyntaxError, UnicodeDecodeError, FileNotFoundError) as e:
+    except (SyntaxError, FileNotFoundError) as e:
         print(f"Warning: Could not parse {file_path}: {e}", file=sys.stderr)
 
     return violations
 
 
+def _content_digest(file_path: Path) -> str:
+    """Return a short digest of a file's bytes.
+
+    Cached results are stamped with it because, unlike mtimes, it survives the
+    fresh checkout of every CI run.
+    """
+    return hashlib.blake2b(file_path.read_bytes(), digest_size=16).hexdigest()
+
+
+def _decode_violations(found: object) -> list[ComplexityViolation]:
+    """Rebuild cached violations from their JSON lists."""
+    if not isinstance(found, list):
+        raise TypeError("expected a list of violations")
+    return [ComplexityViolation(*item) for item in found]
+
+
+def _scan_each(
+    python_files: list[Path], max_cyclomatic: int, max_cognitive: int
+) -> list[list[ComplexityViolation]]:
+    """Return per-file violations, spreading large trees across a process pool."""
+    check = functools.partial(
+        check_file_complexity,
+        max_cyclomatic=max_cyclomatic,
+        max_cognitive=max_cognitive,
+    )
+    return map_files_parallel(check, python_files)
+
+
+def scan_files(
+    python_files: list[Path],
+    max_cyclomatic: int,
+    max_cognitive: int,
+    cache_path: Path | None = None,
+) -> list[ComplexityViolation]:
+    """Check every file, reusing cached results for files whose contents are unchanged."""
+    if cache_path is None:
+        return [
+            violation
+            for found in _scan_each(python_files, max_cyclomatic, max_cognitive)
+            for violation in found
+        ]
+    cache = ResultsCache(
+        cache_path,
+        {
+            "limits": [max_cyclomatic, max_cognitive],
+            "scoring": SCORING_VERSION,
+            "radon": radon_version,
+        },
+        stamp=_content_digest,
+        decode=_decode_violations,
+    )
+    results = cache.scan(
+        python_files,
+        functools.partial(
+            _scan_each, max_cyclomatic=max_cyclomatic, max_cognitive=max_cognitive
+        ),
+    )
+    return [violation for found in results for violation in found]
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Create and configure the CLI argument parser."""
     parser = argparse.ArgumentParser(
@@ -180,6 +243,14 @@ def build_parser() -> argparse.ArgumentParser:
             "May be provided multiple times."
         ),
     )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        help=(
+            "JSON file caching per-file results; files whose contents are "
+            "unchanged are not re-parsed."
+        ),
+    )
     return parser
 
 
@@ -196,22 +267,11 @@ def resolve_excludes(root_path: Path, excludes: list[str]) -> list[Path]:
     return [(root_path / Path(exclude_path)).resolve() for exclude_path in excludes]
 
 
-def is_excluded(path: Path, exclude_paths: list[Path]) -> bool:
-    """Return True when the given path is within one of the excluded paths."""
-    for exclude_path in exclude_paths:
-        try:
-            path.resolve().relative_to(exclude_path)
-        except ValueError:
-            continue
-        return True
-    return False
-
-
 def gather_python_files(root_path: Path, exclude_paths: list[Path]) -> list[Path]:
     """Return all python files under root that are not excluded."""
-    python_files = [
-        path for path in root_path.rglob("*.py") if not is_excluded(path, exclude_paths)
-    ]
+    # Excluded directories are pruned during the scandir walk instead of
+    # resolving and testing every file found beneath them.
+    python_files = list(iter_python_files(root_path, exclusions=exclude_paths))
     if not python_files:
         print(f"No Python files found in {root_path}", file=sys.stderr)
         sys.exit(1)
@@ -229,27 +289,29 @@ def report_violations(
         )
         sys.exit(0)
 
-    print(
+    lines = [
         f"Complexity violations detected (cyclomatic ≤{max_cyclomatic}, "
-        f"cognitive ≤{max_cognitive}):"
-    )
-    print()
-
-    by_file: dict[str, list[ComplexityViolation]] = {}
-    for violation in violations:
-        by_file.setdefault(violation.file_path, []).append(violation)
+        f"cognitive ≤{max_cognitive}):",
+        "",
+    ]
 
-    for file_path in sorted(by_file.keys()):
-        file_violations = by_file[file_path]
-        print(f"{file_path}:")
-        for violation in sorted(file_violations, key=lambda x: x.line_number):
-            print(
+    # One stable sort by (file, line) orders the whole report; groupby then
+    # splits it per file without building a dict of lists to sort again.
+    ordered = sorted(violations, key=attrgetter("file_path", "line_number"))
+    for file_path, file_violations in itertools.groupby(
+        ordered, key=attrgetter("file_path")
+    ):
+        lines.append(f"{file_path}:")
+        for violation in file_violations:
+            lines.append(
                 f"  - Line {violation.line_number}: {violation.function_name} "
                 f"(cyclomatic={violation.cyclomatic}, cognitive={violation.cognitive})"
             )
-        print()
+        lines.append("")
 
-    print(f"Total: {len(violations)} function(s) exceed complexity limits")
+    lines.append(f"Total: {len(violations)} function(s) exceed complexity limits")
+    # One write for the whole report rather than a print per line.
+    sys.stdout.write("\n".join(lines) + "\n")
     sys.exit(1)
 
 
@@ -260,13 +322,9 @@ def main():
     exclude_paths = resolve_excludes(root_path, args.exclude)
     python_files = gather_python_files(root_path, exclude_paths)
 
-    all_violations = []
-    for file_path in python_files:
-        violations = check_file_complexity(
-            file_path, args.max_cyclomatic, args.max_cognitive
-        )
-        all_violations.extend(violations)
-
+    all_violations = scan_files(
+        python_files, args.max_cyclomatic, args.max_cognitive, args.cache
+    )
     report_violations(all_violations, args.max_cyclomatic, args.max_cognitive)
 
 
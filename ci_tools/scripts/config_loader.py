@@ -24,8 +24,8 @@ def load_json_config(
         if not candidate_path.is_file():
             continue
         try:
-            with candidate_path.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
+            # json.loads detects UTF-8/16/32 (and a UTF-8 BOM) from the raw bytes.
+            data = json.loads(candidate_path.read_bytes())
         except json.JSONDecodeError:
             if warn_on_error:
                 print(
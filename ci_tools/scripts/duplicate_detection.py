@@ -1,7 +1,8 @@
 """Detection of suspicious duplicate file patterns."""
 
+import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from ci_tools.scripts.guard_common import iter_python_files
 
@@ -18,6 +19,9 @@ SUSPICIOUS_PATTERNS: Tuple[str, ...] = (
     "_2",
 )
 
+# Most stems match nothing; one alternation scan rejects them in a single pass.
+_SUSPICIOUS_RE = re.compile("|".join(map(re.escape, SUSPICIOUS_PATTERNS)))
+
 FALSE_POSITIVE_RULES: Dict[str, Tuple[str, ...]] = {
     "_temp": ("temperature", "max_temp", "cleanup_temp_artifacts"),
     "_2": ("phase_2", "_v2"),
@@ -37,6 +41,8 @@ def is_false_positive_for_pattern(stem: str, pattern: str) -> bool:
 
 def duplicate_reason(stem: str) -> Optional[str]:
     """Check if a stem contains suspicious patterns, accounting for false positives."""
+    if _SUSPICIOUS_RE.search(stem) is None:
+        return None
     for pattern in SUSPICIOUS_PATTERNS:
         if pattern in stem:
             if not is_false_positive_for_pattern(stem, pattern):
@@ -44,19 +50,24 @@ def duplicate_reason(stem: str) -> Optional[str]:
     return None
 
 
-def find_suspicious_duplicates(root: Path) -> List[Tuple[Path, str]]:
+def find_suspicious_duplicates(
+    root: Path, *, py_files: Optional[Sequence[Path]] = None
+) -> List[Tuple[Path, str]]:
     """
     Find files with suspicious naming patterns that suggest duplicates.
 
     Args:
         root: Root directory to search
+        py_files: Files already found under root, to avoid walking it again
 
     Returns:
         List of (file_path, reason) tuples
     """
     duplicates: List[Tuple[Path, str]] = []
+    if py_files is None:
+        py_files = list(iter_python_files(root))
 
-    for py_file in iter_python_files(root):
+    for py_file in py_files:
         reason = duplicate_reason(py_file.stem)
         if reason:
             duplicates.append((py_file, reason))
@@ -8,20 +8,70 @@ from __future__ import annotations
 
 import argparse
 import ast
+import os
 import subprocess
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Union
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+from ci_tools.scripts import ast_utils, guard_scan
+
+# Tool, cache and environment directories that never hold project sources.
+# They are pruned by name during the walk so their subtrees are never read.
+PRUNED_DIRECTORY_NAMES = frozenset(
+    {
+        ".git",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+        ".venv",
+        "__pycache__",
+        "node_modules",
+    }
+)
+
+
+def _read_directory(directory: str) -> List[os.DirEntry]:
+    """Return the entries of ``directory``, or none if it cannot be read."""
+    try:
+        with os.scandir(directory) as iterator:
+            return list(iterator)
+    except PermissionError:
+        return []
+
+
+def _scan_python_files(root: Path, excluded: frozenset[str]) -> Iterator[Path]:
+    """Walk a directory tree with ``os.scandir`` and yield ``.py`` files.
 
-from ci_tools.scripts import ast_utils
+    ``DirEntry`` type checks reuse the information returned by the directory
+    read, so no per-entry ``stat`` is needed. Symlinked directories are not
+    followed and unreadable directories are skipped, matching ``Path.rglob``.
+    Entries whose path is in ``excluded`` and directories named in
+    ``PRUNED_DIRECTORY_NAMES`` are dropped before descending, so those
+    subtrees are never read.
+    """
+    pending = [os.fspath(root)]
+    while pending:
+        for entry in _read_directory(pending.pop()):
+            if entry.path in excluded or entry.name in PRUNED_DIRECTORY_NAMES:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                pending.append(entry.path)
+            elif entry.name.endswith(".py") and entry.is_file():
+                yield Path(entry.path)
 
 
-def iter_python_files(root: Union[Path, Sequence[Path]]) -> Iterable[Path]:
+def iter_python_files(
+    root: Union[Path, Sequence[Path]], exclusions: Sequence[Path] = ()
+) -> Iterable[Path]:
     """Iterate over all Python files in a directory tree or single file.
 
     Args:
         root: Directory to scan recursively, single Python file, or sequence of paths
+        exclusions: Paths to skip; excluded directories are pruned during the walk.
+            Compared verbatim, so pass them in the same (resolved) form as root.
 
     Yields:
         Path objects for each .py file found
@@ -34,7 +84,7 @@ def iter_python_files(root: Union[Path, Sequence[Path]]) -> Iterable[Path]:
         for base in root:
             if not base.exists():
                 continue
-            yield from iter_python_files(base)
+            yield from iter_python_files(base, exclusions)
         return
 
     # Single Path handling - at this point root must be Path due to early return above
@@ -42,19 +92,25 @@ def iter_python_files(root: Union[Path, Sequence[Path]]) -> Iterable[Path]:
     if not root.exists():
         msg = f"path does not exist: {root}"
         raise OSError(msg)
+    if is_excluded(root, list(exclusions)):
+        return
     if root.is_file():
         if root.suffix == ".py":
             yield root
         return
-    yield from root.rglob("*.py")
+    excluded = frozenset(os.fspath(path) for path in exclusions)
+    yield from _scan_python_files(root, excluded)
 
 
-def parse_python_ast(path: Path, *, raise_on_error: bool = True) -> ast.AST | None:
+def parse_python_ast(
+    path: Path, *, raise_on_error: bool = True, source: bytes | None = None
+) -> ast.AST | None:
     """Parse a Python file into an AST.
 
     Args:
         path: Path to the Python file to parse
         raise_on_error: If True, raise RuntimeError on parse failure; if False, return None
+        source: File contents the caller already read; path is read when None
 
     Returns:
         AST tree for the file, or None if parsing fails and raise_on_error is False
@@ -63,7 +119,9 @@ def parse_python_ast(path: Path, *, raise_on_error: bool = True) -> ast.AST | No
         RuntimeError: If the file cannot be parsed due to syntax errors and raise_on_error is True
     """
     try:
-        source = path.read_text()
+        # ast.parse decodes bytes itself, honouring any PEP 263 coding cookie.
+        if source is None:
+            source = path.read_bytes()
         return ast.parse(source, filename=str(path))
     except (SyntaxError, UnicodeDecodeError, FileNotFoundError, OSError) as exc:
         if raise_on_error:
@@ -165,6 +223,10 @@ count_class_methods = ast_utils.count_class_methods
 iter_ast_nodes = ast_utils.iter_ast_nodes
 count_significant_lines = ast_utils.count_significant_lines
 
+file_stamp = guard_scan.file_stamp
+map_files_parallel = guard_scan.map_files_parallel
+ResultsCache = guard_scan.ResultsCache
+
 
 def create_guard_parser(
     description: str, default_root: Path = Path("src")
@@ -208,9 +270,9 @@ def report_violations(
     if not violations:
         return
 
-    print(header, file=sys.stderr)
-    for violation in sorted(violations):
-        print(f"  - {violation}", file=sys.stderr)
+    # One write for the whole report rather than a print per violation.
+    lines = [header, *(f"  - {violation}" for violation in sorted(violations))]
+    sys.stderr.write("\n".join(lines) + "\n")
 
 
 class GuardRunner(ABC):
@@ -235,6 +297,13 @@ class GuardRunner(ABC):
     def get_violations_header(self, args: argparse.Namespace) -> str:
         """Return header message for violations report."""
 
+    def scan_files(self, paths: Iterable[Path], args: argparse.Namespace) -> List[str]:
+        """Scan files in order; subclasses may override to parallelize."""
+        violations: List[str] = []
+        for path in paths:
+            violations.extend(self.scan_file(path, args))
+        return violations
+
     # pylint: disable=unused-argument
     def get_violations_footer(self, args: argparse.Namespace) -> Optional[str]:
         """Return optional footer message for violations report."""
@@ -250,21 +319,13 @@ class GuardRunner(ABC):
         """Run guard script. Returns 0 if no violations, 1 otherwise."""
         args = self.parse_args(argv)
         root, exclusions = args.root.resolve(), [p.resolve() for p in args.exclude]
-        violations: List[str] = []
+        # Exclusions are pruned during the walk, and the yielded paths are
+        # already rooted at the resolved root, so no per-file filtering remains.
         try:
-            file_iter = list(iter_python_files(root))
-        except OSError as exc:
-            print(f"{self.name}: failed to traverse {root}: {exc}", file=sys.stderr)
+            violations = self.scan_files(self._walk(root, exclusions), args)
+        except RuntimeError as exc:
+            print(str(exc), file=sys.stderr)
             return 1
-        for file_path in file_iter:
-            resolved = file_path.resolve()
-            if is_excluded(resolved, exclusions):
-                continue
-            try:
-                violations.extend(self.scan_file(resolved, args))
-            except RuntimeError as exc:
-                print(str(exc), file=sys.stderr)
-                return 1
         if violations:
             report_violations(violations, self.get_violations_header(args))
             if footer := self.get_violations_footer(args):
@@ -272,6 +333,19 @@ class GuardRunner(ABC):
             return 1
         return 0
 
+    def _walk(self, root: Path, exclusions: List[Path]) -> Iterator[Path]:
+        """Yield files as they are found, reporting walk errors as traversal failures.
+
+        Files are scanned as the walk yields them, so only errors raised by the
+        walk itself pass through here; errors from scanning a file do not.
+        """
+        try:
+            yield from iter_python_files(root, exclusions)
+        except OSError as exc:
+            raise RuntimeError(
+                f"{self.name}: failed to traverse {root}: {exc}"
+            ) from exc
+
     @classmethod
     def main(cls, argv: Optional[Iterable[str]] = None) -> int:
         """Standard main entry point for guard scripts.
@@ -0,0 +1,132 @@
+"""Per-file scan helpers for guard scripts.
+
+Guards that scan many files share these helpers to spread the work across a
+process pool and to reuse results for files that have not changed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Sequence, TypeVar
+
+# Below this many files, worker start-up costs more than scanning serially.
+PARALLEL_MIN_FILES = 64
+PARALLEL_CHUNKSIZE = 32
+
+_Result = TypeVar("_Result")
+
+
+def map_files_parallel(
+    func: Callable[[Path], _Result],
+    paths: Sequence[Path],
+    *,
+    jobs: Optional[int] = None,
+) -> List[_Result]:
+    """Return ``func`` applied to each path in order, using a process pool for large sets.
+
+    ``func`` must be picklable; ``jobs`` caps the workers, and 1 scans serially.
+    """
+    if jobs == 1 or len(paths) < PARALLEL_MIN_FILES:
+        return [func(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(func, paths, chunksize=PARALLEL_CHUNKSIZE))
+
+
+def file_stamp(path: Path) -> str:
+    """Return an ``mtime_ns:size`` stamp used to detect changed files."""
+    stat = path.stat()
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+# Layout of the JSON written by ResultsCache; bump it when the payload changes.
+CACHE_FORMAT_VERSION = 1
+
+# Cached results are keyed by path and paired with the stamp of the file they came from.
+_CacheEntries = dict[str, tuple[str, list]]
+
+
+def _string_list(found: object) -> List[str]:
+    """Return ``found`` if it is a list of strings, the shape most guards cache."""
+    if not isinstance(found, list) or not all(isinstance(item, str) for item in found):
+        raise TypeError("expected a list of strings")
+    return found
+
+
+class ResultsCache:
+    """Per-file guard results persisted as JSON and stamped to spot changed files.
+
+    ``key`` holds what else the results depend on (limits, roots, versions) as
+    plain JSON data; a malformed cache or one saved under another key is empty.
+    """
+
+    def __init__(
+        self,
+        cache_path: Path,
+        key: object,
+        *,
+        stamp: Callable[[Path], str] = file_stamp,
+        decode: Callable[[object], list] = _string_list,
+    ):
+        self.cache_path = cache_path
+        self.key = key
+        self.stamp = stamp
+        self.decode = decode
+
+    def load(self) -> _CacheEntries:
+        """Return the cached entries, or none if the cache cannot be used."""
+        try:
+            payload = json.loads(self.cache_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format") != CACHE_FORMAT_VERSION
+            or payload.get("key") != self.key
+            or not isinstance(payload.get("files"), dict)
+        ):
+            return {}
+        try:
+            return {
+                path_key: (stamp, self.decode(found))
+                for path_key, (stamp, found) in payload["files"].items()
+            }
+        except (TypeError, ValueError):
+            return {}
+
+    def save(self, entries: _CacheEntries) -> None:
+        """Persist the entries for the files seen in this run."""
+        payload = {"format": CACHE_FORMAT_VERSION, "key": self.key, "files": entries}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Guards run together can share a cache directory, so write a sibling
+        # temp file and swap it in; readers never see a partial cache.
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.cache_path.parent, prefix=f"{self.cache_path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+            os.replace(tmp_name, self.cache_path)
+        finally:
+            # Already gone after a successful replace; removes leftovers otherwise.
+            Path(tmp_name).unlink(missing_ok=True)
+
+    def scan(
+        self, paths: Sequence[Path], scan_each: Callable[[List[Path]], Iterable[list]]
+    ) -> List[list]:
+        """Return each path's results, passing only changed files to ``scan_each``."""
+        stamps = {os.fspath(path): self.stamp(path) for path in paths}
+        entries = {
+            path_key: hit
+            for path_key, hit in self.load().items()
+            if hit[0] == stamps.get(path_key)
+        }
+        stale = [path for path in paths if os.fspath(path) not in entries]
+        for path, found in zip(stale, scan_each(stale)):
+            path_key = os.fspath(path)
+            entries[path_key] = (stamps[path_key], found)
+        self.save(entries)
+        return [entries[os.fspath(path)][1] for path in paths]
@@ -1,10 +1,61 @@
 """Import analysis utilities for detecting module imports."""
 
 import ast
+import functools
+import os
 from pathlib import Path
-from typing import Optional, Set
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
-from ci_tools.scripts.guard_common import iter_python_files, parse_python_ast
+from ci_tools.scripts.guard_common import (
+    ResultsCache,
+    iter_python_files,
+    map_files_parallel,
+    parse_python_ast,
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_cached(path: Path, source: bytes) -> Optional[ast.AST]:
+    """Parse ``source`` read from ``path``; the bytes key the cache so edited files re-parse."""
+    return parse_python_ast(path, raise_on_error=False, source=source)
+
+
+def read_source(path: Path) -> Optional[bytes]:
+    """
+    Return a file's raw bytes, or None if it cannot be read.
+
+    Callers scan the bytes with a C-level substring test to skip files that
+    cannot contain the construct they look for, then pass the same bytes to
+    load_module_ast so each file is read only once.
+    """
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def load_module_ast(path: Path, source: Optional[bytes] = None) -> Optional[ast.AST]:
+    """
+    Return the AST for a Python file, reusing recently parsed trees.
+
+    CLI entry point detection reads files the import pass may have just parsed;
+    trees are memoized on the path and source bytes in a bounded cache so the
+    reuse does not keep every tree of a large parent alive. Import passes that
+    run in a process pool parse in the workers, so their trees are not shared
+    with the main process.
+
+    Args:
+        path: Python file to parse
+        source: Bytes already read from path by the caller; path is read when None
+
+    Returns:
+        Parsed tree, or None if the file cannot be read or parsed
+    """
+    if source is None:
+        source = read_source(path)
+        if source is None:
+            return None
+    return _parse_cached(path, source)
 
 
 def get_module_name(file_path: Path, root: Path) -> str:
@@ -30,6 +81,22 @@ def get_module_name(file_path: Path, root: Path) -> str:
     return ".".join(parts) if parts else ""
 
 
+@functools.lru_cache(maxsize=4096)
+def _dot_prefixes(module: str) -> Tuple[str, ...]:
+    """Return every dotted prefix of ``module``, e.g. ``("a", "a.b", "a.b.c")``.
+
+    The same module strings recur across many import statements, so results are
+    memoized and built by slicing at each dot rather than splitting and joining.
+    """
+    prefixes = []
+    end = module.find(".")
+    while end != -1:
+        prefixes.append(module[:end])
+        end = module.find(".", end + 1)
+    prefixes.append(module)
+    return tuple(prefixes)
+
+
 class ImportCollector(ast.NodeVisitor):  # pylint: disable=invalid-name
     """Collects all import statements from a Python file."""
 
@@ -38,23 +105,33 @@ class ImportCollector(ast.NodeVisitor):  # pylint: disable=invalid-name
         self.file_path = file_path
         self.root = root
 
+    def visit(self, node: ast.AST) -> None:
+        """Collect the imports anywhere under ``node`` in one flat walk.
+
+        Only import statements matter, so this skips NodeVisitor's per-node
+        method lookup and generic_visit recursion for every other node.
+        """
+        for child in ast.walk(node):
+            if isinstance(child, ast.Import):
+                self.visit_Import(child)
+            elif isinstance(child, ast.ImportFrom):
+                self.visit_ImportFrom(child)
+
     def visit_Import(self, node: ast.Import) -> None:  # pylint: disable=invalid-name
         """Visit 'import foo' statements."""
         for alias in node.names:
-            module = alias.name
-            if module.startswith("src."):
-                module = module[4:]
-            parts = module.split(".")
-            for i in range(len(parts)):
-                self.imports.add(".".join(parts[: i + 1]))
-        self.generic_visit(node)
+            self.imports.update(_dot_prefixes(alias.name.removeprefix("src.")))
 
-    def _resolve_relative_import(self, node: ast.ImportFrom) -> None:
-        """Handle relative imports like 'from . import X'."""
+    @functools.cached_property
+    def _file_module(self) -> str:
+        """Module name of the visited file, computed once for all relative imports."""
         if not (self.file_path and self.root):
-            return
+            return ""
+        return get_module_name(self.file_path, self.root)
 
-        file_module = get_module_name(self.file_path, self.root)
+    def _resolve_relative_import(self, node: ast.ImportFrom) -> None:
+        """Handle relative imports like 'from . import X'."""
+        file_module = self._file_module
         if not file_module:
             return
 
@@ -74,12 +151,8 @@ class ImportCollector(ast.NodeVisitor):  # pylint: disable=invalid-name
 
     def _resolve_absolute_import(self, module: str, names: list) -> None:
         """Handle absolute imports like 'from foo import bar'."""
-        if module.startswith("src."):
-            module = module[4:]
-
-        parts = module.split(".")
-        for i in range(len(parts)):
-            self.imports.add(".".join(parts[: i + 1]))
+        module = module.removeprefix("src.")
+        self.imports.update(_dot_prefixes(module))
 
         for alias in names:
             if alias.name != "*":
@@ -94,37 +167,147 @@ class ImportCollector(ast.NodeVisitor):  # pylint: disable=invalid-name
         elif node.module:
             self._resolve_absolute_import(node.module, node.names)
 
-        self.generic_visit(node)
+
+def _collect_file_imports(py_file: Path, roots: Tuple[Path, ...]) -> Set[str]:
+    """Return a file's imports resolved against each root, parsing it only once."""
+    source = read_source(py_file)
+    # Every import statement, including 'from x import y', spells out 'import'.
+    if source is None or b"import" not in source:
+        return set()
+    tree = load_module_ast(py_file, source)
+    if tree is None:
+        return set()
+    imports: Set[str] = set()
+    for root in roots:
+        collector = ImportCollector(file_path=py_file, root=root)
+        collector.visit(tree)
+        imports.update(collector.imports)
+    return imports
+
+
+def _map_file_imports(
+    py_files: Sequence[Path],
+    file_roots: Sequence[Tuple[Path, ...]],
+    jobs: Optional[int],
+) -> List[Set[str]]:
+    """Return each file's imports in order; large trees use a process pool."""
+    # Files share a handful of root tuples, so each group maps with one partial.
+    groups: Dict[Tuple[Path, ...], List[int]] = {}
+    for index, roots in enumerate(file_roots):
+        groups.setdefault(roots, []).append(index)
+    results: List[Set[str]] = [set() for _ in py_files]
+    for roots, indexes in groups.items():
+        collect = functools.partial(_collect_file_imports, roots=roots)
+        group_files = [py_files[index] for index in indexes]
+        for index, imports in zip(
+            indexes, map_files_parallel(collect, group_files, jobs=jobs)
+        ):
+            results[index] = imports
+    return results
+
+
+def _collect_imports(
+    py_files: Sequence[Path],
+    file_roots: Sequence[Tuple[Path, ...]],
+    jobs: Optional[int],
+) -> Set[str]:
+    """Union the imports of each file against its roots."""
+    all_imports: Set[str] = set()
+    for imports in _map_file_imports(py_files, file_roots, jobs):
+        all_imports.update(imports)
+    return all_imports
+
+
+def _collect_imports_cached(
+    py_files: Sequence[Path],
+    file_roots: Sequence[Tuple[Path, ...]],
+    jobs: Optional[int],
+    cache_path: Path,
+    roots: List[str],
+) -> Set[str]:
+    """Union per-file imports, re-parsing only files changed since the cache was saved."""
+    roots_by_file = dict(zip(py_files, file_roots))
+
+    def _scan_each(stale: List[Path]) -> Iterator[List[str]]:
+        stale_roots = [roots_by_file[py_file] for py_file in stale]
+        for imports in _map_file_imports(stale, stale_roots, jobs):
+            yield sorted(imports)
+
+    found = ResultsCache(cache_path, {"roots": roots}).scan(py_files, _scan_each)
+    return {name for imports in found for name in imports}
 
 
-def collect_all_imports(root: Path) -> Set[str]:
+def collect_all_imports(
+    root: Path,
+    jobs: Optional[int] = None,
+    *,
+    py_files: Optional[Sequence[Path]] = None,
+) -> Set[str]:
     """
     Collect all imported module names from all Python files.
 
+    Large trees are parsed across a process pool.
+
     Args:
         root: Root directory to search
+        jobs: Worker processes to use; None uses every CPU and 1 parses serially
+        py_files: Files already found under root, to avoid walking it again
 
     Returns:
         Set of all imported module names
     """
-    all_imports: Set[str] = set()
-
-    for py_file in iter_python_files(root):
-        tree = parse_python_ast(py_file, raise_on_error=False)
-        if tree is None:
-            continue
-
-        collector = ImportCollector(file_path=py_file, root=root)
-        collector.visit(tree)
-        all_imports.update(collector.imports)
-
-    return all_imports
+    if py_files is None:
+        py_files = list(iter_python_files(root))
+    return _collect_imports(py_files, [(root,)] * len(py_files), jobs)
+
+
+def collect_all_imports_with_parent(
+    root: Path,
+    jobs: Optional[int] = None,
+    *,
+    root_files: Optional[Sequence[Path]] = None,
+    parent_files: Optional[Sequence[Path]] = None,
+    cache_path: Optional[Path] = None,
+) -> Set[str]:
+    """
+    Collect all imports from root and parent directory.
 
+    Files under root are resolved against both directories, since relative
+    imports name different modules from each; the parent is walked once and
+    every file is parsed once.
 
-def collect_all_imports_with_parent(root: Path) -> Set[str]:
-    """Collect all imports from root and parent directory."""
-    imports = collect_all_imports(root)
+    Args:
+        root: Root directory to search
+        jobs: Worker processes to use; None uses every CPU and 1 parses serially
+        root_files: Files already found under root, to avoid walking it again
+        parent_files: Files already found under root's parent, likewise
+        cache_path: JSON file of per-file imports keyed by mtime and size; files
+            that have not changed since it was saved are not re-parsed
+    """
+    if root_files is None:
+        root_files = list(iter_python_files(root))
     parent = root.parent
-    if parent.exists():
-        imports.update(collect_all_imports(parent))
-    return imports
+    if not parent.exists():
+        return collect_all_imports(root, jobs, py_files=root_files)
+
+    pending = set(root_files)
+    py_files: List[Path] = []
+    file_roots: List[Tuple[Path, ...]] = []
+    if parent_files is None:
+        parent_files = list(iter_python_files(parent))
+    for py_file in parent_files:
+        py_files.append(py_file)
+        if py_file in pending:
+            pending.discard(py_file)
+            file_roots.append((root, parent))
+        else:
+            file_roots.append((parent,))
+    # Root files the parent walk excluded still count against root alone.
+    for py_file in root_files:
+        if py_file in pending:
+            py_files.append(py_file)
+            file_roots.append((root,))
+    if cache_path is None:
+        return _collect_imports(py_files, file_roots, jobs)
+    roots = [os.fspath(root), os.fspath(parent)]
+    return _collect_imports_cached(py_files, file_roots, jobs, cache_path, roots)
@@ -1,11 +1,38 @@
 """Module import checking utilities."""
 
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Set
+from typing import AbstractSet, FrozenSet, Iterable
+
+
+@dataclass(frozen=True)
+class ImportIndex:
+    """Imported module names plus the number of imports beneath each dotted prefix.
+
+    ``descendant_counts["a.b"]`` counts imports such as ``a.b.c`` and ``a.b.c.d``,
+    so child and sibling lookups are dictionary hits instead of scans over every
+    imported name.
+    """
+
+    names: FrozenSet[str]
+    descendant_counts: Counter[str]
+
+    @classmethod
+    def build(cls, all_imports: Iterable[str]) -> "ImportIndex":
+        """Index a collection of imported module names."""
+        names = frozenset(all_imports)
+        counts: Counter[str] = Counter()
+        for name in names:
+            end = name.find(".")
+            while end != -1:
+                counts[name[:end]] += 1
+                end = name.find(".", end + 1)
+        return cls(names=names, descendant_counts=counts)
 
 
 def check_exact_match(
-    module_name: str, file_stem: str, all_imports: Set[str], root: Path
+    module_name: str, file_stem: str, all_imports: AbstractSet[str], root: Path
 ) -> bool:
     """Check for exact module name matches."""
     if module_name in all_imports:
@@ -19,53 +46,50 @@ def check_exact_match(
     return False
 
 
-def check_child_imported(module_name: str, all_imports: Set[str]) -> bool:
+def check_child_imported(module_name: str, index: ImportIndex) -> bool:
     """Check if any child module is imported."""
-    for imported in all_imports:
-        if imported.startswith(module_name + "."):
-            return True
-        if imported.startswith(f"src.{module_name}."):
-            return True
-    return False
+    counts = index.descendant_counts
+    return module_name in counts or f"src.{module_name}" in counts
 
 
 def has_specific_child_imports(
-    parent: str, module_name: str, all_imports: Set[str]
+    parent: str, module_name: str, index: ImportIndex
 ) -> bool:
     """Check if parent has specific child imports that exclude this module."""
-    return any(
-        imp.startswith(parent + ".") and imp != module_name for imp in all_imports
-    )
+    # module_name lives under parent, so it is one of parent's descendants when imported.
+    return index.descendant_counts[parent] > (module_name in index.names)
 
 
-def check_parent_imported(module_name: str, all_imports: Set[str]) -> bool:
+def check_parent_imported(module_name: str, index: ImportIndex) -> bool:
     """Check if a parent module is imported wholesale."""
-    module_parts = module_name.split(".")
-    for i in range(len(module_parts) - 1):
-        parent = ".".join(module_parts[: i + 1])
-        if parent in all_imports or f"src.{parent}" in all_imports:
-            if not has_specific_child_imports(parent, module_name, all_imports):
+    # Slice each proper dotted prefix in place rather than re-joining split parts.
+    end = module_name.find(".")
+    while end != -1:
+        parent = module_name[:end]
+        if parent in index.names or f"src.{parent}" in index.names:
+            if not has_specific_child_imports(parent, module_name, index):
                 return True
+        end = module_name.find(".", end + 1)
     return False
 
 
 def module_is_imported(
     module_name: str,
     file_stem: str,
-    all_imports: Set[str],
+    index: ImportIndex,
     root: Path,
 ) -> bool:
     """Check if a module is imported anywhere in the codebase."""
     if not module_name:
         return True
 
-    if check_exact_match(module_name, file_stem, all_imports, root):
+    if check_exact_match(module_name, file_stem, index.names, root):
         return True
 
-    if check_child_imported(module_name, all_imports):
+    if check_child_imported(module_name, index):
         return True
 
-    if check_parent_imported(module_name, all_imports):
+    if check_parent_imported(module_name, index):
         return True
 
     return False
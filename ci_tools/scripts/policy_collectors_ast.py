@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import ast
+import hashlib
+import os
 import shutil
 from collections import defaultdict
+from pathlib import Path
 from typing import Dict, Iterable, Iterator, List, Tuple
 
 from ci_tools.scripts.guard_common import relative_path
@@ -14,6 +17,7 @@ from .policy_context import (
     FunctionEntry,
     ModuleContext,
     iter_module_contexts,
+    iter_until_violation,
     normalize_function,
 )
 from .policy_visitors import (
@@ -57,7 +61,8 @@ def collect_long_functions(threshold: int) -> Iterable[FunctionEntry]:
 def collect_broad_excepts() -> List[Tuple[str, int]]:
     """Collect exception handlers that catch broad exception types."""
     records: List[Tuple[str, int]] = []
-    for ctx in iter_non_init_modules((ROOT / "src",), include_lines=True):
+    contexts = iter_non_init_modules((ROOT / "src",), include_source=True)
+    for ctx in iter_until_violation(contexts, records):
         BroadExceptVisitor(ctx, records).visit(ctx.tree)
     return records
 
@@ -65,7 +70,8 @@ def collect_broad_excepts() -> List[Tuple[str, int]]:
 def collect_silent_handlers() -> List[Tuple[str, int, str]]:
     """Collect exception handlers that silently swallow exceptions."""
     records: List[Tuple[str, int, str]] = []
-    for ctx in iter_non_init_modules((ROOT / "src",), include_lines=True):
+    contexts = iter_non_init_modules((ROOT / "src",), include_source=True)
+    for ctx in iter_until_violation(contexts, records):
         SilentHandlerVisitor(ctx, records).visit(ctx.tree)
     return records
 
@@ -73,7 +79,8 @@ def collect_silent_handlers() -> List[Tuple[str, int, str]]:
 def collect_generic_raises() -> List[Tuple[str, int]]:
     """Collect raise statements that raise generic exception types."""
     records: List[Tuple[str, int]] = []
-    for ctx in iter_non_init_modules((ROOT / "src",)):
+    contexts = iter_non_init_modules((ROOT / "src",))
+    for ctx in iter_until_violation(contexts, records):
         GenericRaiseVisitor(ctx.rel_path, records).visit(ctx.tree)
     return records
 
@@ -81,7 +88,8 @@ def collect_generic_raises() -> List[Tuple[str, int]]:
 def collect_literal_fallbacks() -> List[Tuple[str, int, str]]:
     """Collect function calls that use literal fallback values."""
     records: List[Tuple[str, int, str]] = []
-    for ctx in iter_module_contexts():
+    contexts = iter_module_contexts()
+    for ctx in iter_until_violation(contexts, records):
         if ctx.rel_path.startswith(("scripts/", "ci_runtime/", "vendor/")):
             continue
         LiteralFallbackVisitor(ctx.rel_path, records).visit(ctx.tree)
@@ -91,7 +99,8 @@ def collect_literal_fallbacks() -> List[Tuple[str, int, str]]:
 def collect_bool_fallbacks() -> List[Tuple[str, int]]:
     """Collect boolean 'or' expressions that use literal fallback values."""
     records: List[Tuple[str, int]] = []
-    for ctx in iter_module_contexts():
+    contexts = iter_module_contexts()
+    for ctx in iter_until_violation(contexts, records):
         if ctx.rel_path.startswith(("scripts/", "ci_runtime/", "vendor/")):
             continue
         BoolFallbackVisitor(ctx.rel_path, records).visit(ctx.tree)
@@ -101,7 +110,8 @@ def collect_bool_fallbacks() -> List[Tuple[str, int]]:
 def collect_conditional_literal_returns() -> List[Tuple[str, int]]:
     """Collect return statements with literals inside None guards."""
     records: List[Tuple[str, int]] = []
-    for ctx in iter_module_contexts():
+    contexts = iter_module_contexts()
+    for ctx in iter_until_violation(contexts, records):
         if ctx.rel_path.startswith(("scripts/", "ci_runtime/", "vendor/")):
             continue
         ConditionalLiteralVisitor(ctx.rel_path, records).visit(ctx.tree)
@@ -111,7 +121,8 @@ def collect_conditional_literal_returns() -> List[Tuple[str, int]]:
 def collect_backward_compat_blocks() -> List[Tuple[str, int, str]]:
     """Collect backward compatibility code blocks."""
     records: List[Tuple[str, int, str]] = []
-    for ctx in iter_module_contexts(include_source=True):
+    contexts = iter_module_contexts(include_source=True)
+    for ctx in iter_until_violation(contexts, records):
         if ctx.rel_path.startswith(("scripts/", "ci_runtime/", "vendor/")):
             continue
         LegacyVisitor(ctx, records).visit(ctx.tree)
@@ -121,7 +132,8 @@ def collect_backward_compat_blocks() -> List[Tuple[str, int, str]]:
 def collect_forbidden_sync_calls() -> List[Tuple[str, int, str]]:
     """Collect forbidden synchronous function calls."""
     records: List[Tuple[str, int, str]] = []
-    for ctx in iter_module_contexts((ROOT / "src",)):
+    contexts = iter_module_contexts((ROOT / "src",))
+    for ctx in iter_until_violation(contexts, records):
         SyncCallVisitor(ctx.rel_path, records).visit(ctx.tree)
     return records
 
@@ -130,8 +142,12 @@ def _function_entries_from_context(
     ctx: ModuleContext,
     *,
     min_length: int,
-) -> Iterator[Tuple[str, FunctionEntry]]:
-    """Extract function entries from a module context for duplicate detection."""
+) -> Iterator[Tuple[bytes, FunctionEntry]]:
+    """Extract function entries from a module context for duplicate detection.
+
+    Keys are 16-byte BLAKE2b digests of the normalized AST dump so the dump
+    string can be released as soon as the function has been hashed.
+    """
     for node in ast.walk(ctx.tree):
         if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             continue
@@ -140,7 +156,9 @@ def _function_entries_from_context(
         length = node.end_lineno - node.lineno + 1
         if length < min_length:
             continue
-        key = normalize_function(node)
+        key = hashlib.blake2b(
+            normalize_function(node).encode("utf-8"), digest_size=16
+        ).digest()
         entry = FunctionEntry(
             path=ctx.path,
             name=node.name,
@@ -152,7 +170,7 @@ def _function_entries_from_context(
 
 def collect_duplicate_functions(min_length: int = 6) -> List[List[FunctionEntry]]:
     """Collect groups of duplicate function implementations."""
-    mapping: Dict[str, List[FunctionEntry]] = defaultdict(list)
+    mapping: Dict[bytes, List[FunctionEntry]] = defaultdict(list)
     for ctx in iter_non_init_modules():
         if ctx.rel_path.startswith(("scripts/", "ci_runtime/", "vendor/")):
             continue
@@ -167,30 +185,40 @@ def collect_duplicate_functions(min_length: int = 6) -> List[List[FunctionEntry]
     return duplicates
 
 
+def _walk_bytecode() -> Iterator[Tuple[Path, bool]]:
+    """Yield bytecode artifacts under ROOT as ``(path, is_directory)`` pairs.
+
+    Uses a single ``os.walk`` pass and prunes ``__pycache__`` directories so
+    their contents are never traversed.
+    """
+    for dirpath, dirnames, filenames in os.walk(ROOT):
+        base = Path(dirpath)
+        if "__pycache__" in dirnames:
+            dirnames.remove("__pycache__")
+            yield base / "__pycache__", True
+        for filename in filenames:
+            if filename.endswith(".pyc"):
+                yield base / filename, False
+
+
 def collect_bytecode_artifacts() -> List[str]:
     """Collect bytecode artifacts (.pyc files and __pycache__ directories)."""
-    offenders: List[str] = []
-    for path in ROOT.rglob("*.pyc"):
-        rel_path = relative_path(path, as_string=True)
-        assert isinstance(rel_path, str)
-        offenders.append(rel_path)
-    for path in ROOT.rglob("__pycache__"):
-        rel_path = relative_path(path, as_string=True)
-        assert isinstance(rel_path, str)
-        offenders.append(rel_path)
-    return sorted(set(offenders))
+    offenders = {
+        str(relative_path(path, as_string=True)) for path, _ in _walk_bytecode()
+    }
+    return sorted(offenders)
 
 
 def purge_bytecode_artifacts() -> None:
     """Remove bytecode artifacts (.pyc files and __pycache__ directories)."""
-    for path in ROOT.rglob("*.pyc"):
+    for path, is_directory in _walk_bytecode():
+        if is_directory:
+            shutil.rmtree(path, ignore_errors=True)
+            continue
         try:
             path.unlink()
         except FileNotFoundError:
             continue
-    for path in ROOT.rglob("__pycache__"):
-        if path.is_dir():
-            shutil.rmtree(path, ignore_errors=True)
 
 
 __all__ = [
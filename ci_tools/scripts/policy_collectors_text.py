@@ -17,21 +17,20 @@ from .policy_context import (
     ROOT,
     SUPPRESSION_PATTERNS,
     iter_module_contexts,
+    iter_until_violation,
 )
 
 # Paths to skip during policy collection
 _SKIP_PATH_PREFIXES = ("scripts/", "ci_runtime/", "vendor/")
 
-# Pre-computed legacy patterns (forbidden suffixes, directory parts, and prefixes)
+# Pre-computed legacy patterns (forbidden suffixes, directory parts, and prefixes).
+# Module paths are normalized to forward slashes by relative_path, so no
+# backslash variants are needed.
 _FORBIDDEN_SUFFIXES = tuple(f"{suffix}.py" for suffix in LEGACY_SUFFIXES)
 _DIR_TOKENS = tuple(token.strip("_") for token in LEGACY_SUFFIXES)
-_FORBIDDEN_PARTS = tuple(f"/{token}/" for token in _DIR_TOKENS) + tuple(
-    f"\\{token}\\" for token in _DIR_TOKENS
-)
-_FORBIDDEN_PREFIXES = tuple(f"{token}/" for token in _DIR_TOKENS) + tuple(
-    f"{token}\\" for token in _DIR_TOKENS
-)
-_LEGACY_PATTERNS = (_FORBIDDEN_SUFFIXES, _FORBIDDEN_PARTS, _FORBIDDEN_PREFIXES)
+_FORBIDDEN_PARTS = tuple(f"/{token}/" for token in _DIR_TOKENS)
+_FORBIDDEN_PREFIXES = tuple(f"{token}/" for token in _DIR_TOKENS)
+_FORBIDDEN_SUBSTRINGS = _FORBIDDEN_SUFFIXES + _FORBIDDEN_PARTS
 
 
 def _should_skip_path(rel_path: str) -> bool:
@@ -44,16 +43,17 @@ def _keyword_token_lines(
     keyword_lookup: Dict[str, str],
 ) -> Dict[str, Set[int]]:
     hits: Dict[str, Set[int]] = {}
+    tokens = tokenize.generate_tokens(io.StringIO(source).readline)
     try:
-        tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+        # The generator raises lazily, so errors surface while iterating.
+        for token in tokens:
+            if token.type != tokenize.NAME:
+                continue
+            keyword = keyword_lookup.get(token.string.lower())
+            if keyword:
+                hits.setdefault(keyword, set()).add(token.start[0])
     except tokenize.TokenError:
         return {}
-    for token in tokens:
-        if token.type != tokenize.NAME:
-            continue
-        keyword = keyword_lookup.get(token.string.lower())
-        if keyword:
-            hits.setdefault(keyword, set()).add(token.start[0])
     return hits
 
 
@@ -83,7 +83,8 @@ def _collect_line_tokens(token_list: List[str]) -> List[Tuple[str, int, str]]:
         List of (rel_path, lineno, token) tuples for each match
     """
     records: List[Tuple[str, int, str]] = []
-    for ctx in iter_module_contexts(include_source=True):
+    contexts = iter_module_contexts(include_source=True)
+    for ctx in iter_until_violation(contexts, records):
         if ctx.source is None:
             continue
         if _should_skip_path(ctx.rel_path):
@@ -105,29 +106,20 @@ def collect_suppressions() -> List[Tuple[str, int, str]]:
     return _collect_line_tokens(list(SUPPRESSION_PATTERNS))
 
 
-def _has_legacy_pattern(
-    lowered_path: str,
-    patterns: Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]],
-) -> bool:
-    """Check if a lowercased path contains any legacy patterns."""
-    forbidden_suffixes, forbidden_parts, forbidden_prefixes = patterns
-    if any(suffix in lowered_path for suffix in forbidden_suffixes):
-        return True
-    if any(part in lowered_path for part in forbidden_parts):
-        return True
-    if any(lowered_path.startswith(prefix) for prefix in forbidden_prefixes):
+def _has_legacy_pattern(lowered_path: str) -> bool:
+    """Check if a lowercased, forward-slash path contains any legacy patterns."""
+    if lowered_path.startswith(_FORBIDDEN_PREFIXES):
         return True
-    return False
+    return any(token in lowered_path for token in _FORBIDDEN_SUBSTRINGS)
 
 
 def collect_legacy_modules() -> List[Tuple[str, int, str]]:
     """Collect legacy/deprecated module patterns."""
     records: List[Tuple[str, int, str]] = []
-    for ctx in iter_module_contexts():
+    for ctx in iter_until_violation(iter_module_contexts(), records):
         if _should_skip_path(ctx.rel_path):
             continue
-        lowered = ctx.rel_path.lower()
-        if _has_legacy_pattern(lowered, _LEGACY_PATTERNS):
+        if _has_legacy_pattern(ctx.rel_path.lower()):
             records.append((ctx.rel_path, 1, "legacy module path"))
     return records
 
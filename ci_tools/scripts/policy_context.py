@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import ast
+import os
 from copy import deepcopy
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator, List, Optional, Sequence
+from typing import Iterable, Iterator, List, Optional, Sequence, Sized, TypeVar
 
 from ci_tools.scripts.guard_common import (
     iter_python_files,
@@ -59,6 +60,9 @@ LEGACY_CONFIG_TOKENS: tuple[str, ...] = (
 )
 CONFIG_EXTENSIONS: tuple[str, ...] = (".json", ".toml", ".yaml", ".yml", ".ini")
 BROAD_EXCEPTION_NAMES = {"Exception", "BaseException"}
+FAIL_FAST_ENV_VAR = "POLICY_GUARD_FAIL_FAST"
+
+_T = TypeVar("_T")
 
 
 @dataclass(frozen=True)
@@ -81,6 +85,12 @@ class ModuleContext:
     source: Optional[str] = None
     lines: Optional[List[str]] = None
 
+    def get_lines(self) -> List[str]:
+        """Return the module's source lines, splitting the source on first use."""
+        if self.lines is None:
+            self.lines = self.source.splitlines() if self.source else []
+        return self.lines
+
 
 class FunctionNormalizer(ast.NodeTransformer):  # pylint: disable=invalid-name
     """Normalizes function ASTs for structural comparison by replacing names and constants."""
@@ -194,16 +204,41 @@ def iter_module_contexts(
         )
 
 
+def fail_fast_enabled() -> bool:
+    """Return True when POLICY_GUARD_FAIL_FAST=1 requests early termination."""
+    return os.environ.get(FAIL_FAST_ENV_VAR) == "1"
+
+
+def iter_until_violation(items: Iterable[_T], records: Sized) -> Iterator[_T]:
+    """Yield items, stopping after the first one that adds to ``records``.
+
+    Short-circuiting only happens in fail-fast mode; otherwise every item is
+    yielded so collectors report the complete set of violations.
+    """
+    if not fail_fast_enabled():
+        yield from items
+        return
+    for item in items:
+        yield item
+        if records:
+            return
+
+
 def get_call_qualname(node: ast.AST) -> str | None:
-    """Extract the qualified name from a Call node (e.g., 'module.function')."""
-    if isinstance(node, ast.Name):
-        return node.id
-    if isinstance(node, ast.Attribute):
-        base = get_call_qualname(node.value)
-        if base is None:
-            return None
-        return f"{base}.{node.attr}"
-    return None
+    """Extract the qualified name from a Call node (e.g., 'module.function').
+
+    Walks the attribute chain iteratively and joins the parts once, rather
+    than building an intermediate string per attribute level.
+    """
+    parts: List[str] = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    parts.reverse()
+    return ".".join(parts)
 
 
 def _sequence_element_has_literal(elt: ast.AST) -> bool:
@@ -315,11 +350,14 @@ __all__ = [
     "LEGACY_CONFIG_TOKENS",
     "CONFIG_EXTENSIONS",
     "BROAD_EXCEPTION_NAMES",
+    "FAIL_FAST_ENV_VAR",
     "FunctionEntry",
     "ModuleContext",
     "FunctionNormalizer",
     "normalize_function",
     "iter_module_contexts",
+    "fail_fast_enabled",
+    "iter_until_violation",
     "get_call_qualname",
     "contains_literal_dataset",
     "is_non_none_literal",
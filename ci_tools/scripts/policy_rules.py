@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List, Tuple
+from typing import Callable, List, Sequence, Tuple
 
 from .policy_collectors_ast import (
     collect_backward_compat_blocks,
@@ -35,14 +35,34 @@ class PolicyViolation(Exception):
     """Raised when the policy guard detects a violation."""
 
 
+def _raise_sorted_records(
+    header: str,
+    records: Sequence[Tuple[str, int, str]],
+    render: Callable[[str, int, str], str],
+) -> None:
+    """Raise PolicyViolation listing records sorted by (path, lineno, detail).
+
+    Records are sorted as tuples before formatting so comparisons never touch
+    the rendered message strings.
+    """
+    if not records:
+        return
+    details = "\n".join(render(*record) for record in sorted(records))
+    raise PolicyViolation(header + details)
+
+
+def _render_reason(path: str, lineno: int, reason: str) -> str:
+    return f"{path}:{lineno} -> {reason}"
+
+
 def enforce_occurrences(discovered: List[Tuple[str, int]], message: str) -> None:
     """Raise PolicyViolation if any occurrences are found."""
     if not discovered:
         return
-    violations = [f"{path}:{lineno} -> {message}" for path, lineno in discovered]
-    raise PolicyViolation(
-        "Policy violations detected:\n" + "\n".join(sorted(violations))
+    details = "\n".join(
+        f"{path}:{lineno} -> {message}" for path, lineno in sorted(discovered)
     )
+    raise PolicyViolation("Policy violations detected:\n" + details)
 
 
 def enforce_duplicate_functions(duplicates: List[List[FunctionEntry]]) -> None:
@@ -65,23 +85,24 @@ def _check_keyword_policy() -> None:
     keyword_hits = scan_keywords()
     for keyword, files in keyword_hits.items():
         for path, lines in files.items():
-            messages = [f"{path}:{lineno} -> keyword '{keyword}'" for lineno in lines]
-            if messages:
+            if lines:
+                details = "\n".join(
+                    f"{path}:{lineno} -> keyword '{keyword}'"
+                    for lineno in sorted(lines)
+                )
                 raise PolicyViolation(
-                    "Banned keyword policy violations detected:\n"
-                    + "\n".join(sorted(messages))
+                    "Banned keyword policy violations detected:\n" + details
                 )
 
 
 def _check_flagged_tokens() -> None:
-    flagged_tokens = collect_flagged_tokens()
-    if not flagged_tokens:
-        return
-    details = "\n".join(
-        f"{path}:{lineno} -> flagged token '{token}' detected"
-        for path, lineno, token in sorted(flagged_tokens)
+    _raise_sorted_records(
+        "Flagged annotations detected:\n",
+        collect_flagged_tokens(),
+        lambda path, lineno, token: (
+            f"{path}:{lineno} -> flagged token '{token}' detected"
+        ),
     )
-    raise PolicyViolation("Flagged annotations detected:\n" + details)
 
 
 def _check_function_lengths() -> None:
@@ -95,14 +116,12 @@ def enforce_function_lengths(
     """Raise PolicyViolation if any functions exceed the length threshold."""
     if not found:
         return
-    violations = [
+    details = "\n".join(
         f"{entry.path}:{entry.lineno} -> function '{entry.name}' "
         f"length {entry.length} exceeds {threshold}"
-        for entry in found
-    ]
-    raise PolicyViolation(
-        "Function length policy violations detected:\n" + "\n".join(sorted(violations))
+        for entry in sorted(found, key=lambda item: (str(item.path), item.lineno))
     )
+    raise PolicyViolation("Function length policy violations detected:\n" + details)
 
 
 def _check_broad_excepts() -> None:
@@ -111,14 +130,11 @@ def _check_broad_excepts() -> None:
 
 
 def _check_silent_handlers() -> None:
-    silent_handlers = collect_silent_handlers()
-    if not silent_handlers:
-        return
-    details = "\n".join(
-        f"{path}:{lineno} -> {reason}"
-        for path, lineno, reason in sorted(silent_handlers)
+    _raise_sorted_records(
+        "Silent exception handler detected:\n",
+        collect_silent_handlers(),
+        _render_reason,
     )
-    raise PolicyViolation("Silent exception handler detected:\n" + details)
 
 
 def _check_generic_raises() -> None:
@@ -127,14 +143,11 @@ def _check_generic_raises() -> None:
 
 
 def _check_literal_fallbacks() -> None:
-    literal_fallbacks = collect_literal_fallbacks()
-    if not literal_fallbacks:
-        return
-    details = "\n".join(
-        f"{path}:{lineno} -> {reason}"
-        for path, lineno, reason in sorted(literal_fallbacks)
+    _raise_sorted_records(
+        "Fallback default usage detected:\n",
+        collect_literal_fallbacks(),
+        _render_reason,
     )
-    raise PolicyViolation("Fallback default usage detected:\n" + details)
 
 
 def _check_boolean_fallbacks() -> None:
@@ -148,54 +161,38 @@ def _check_conditional_literals() -> None:
 
 
 def _check_backward_compat() -> None:
-    backward_compat = collect_backward_compat_blocks()
-    if not backward_compat:
-        return
-    details = "\n".join(
-        f"{path}:{lineno} -> {reason}"
-        for path, lineno, reason in sorted(backward_compat)
+    _raise_sorted_records(
+        "Backward compatibility code detected:\n",
+        collect_backward_compat_blocks(),
+        _render_reason,
     )
-    raise PolicyViolation("Backward compatibility code detected:\n" + details)
 
 
 def _check_legacy_artifacts() -> None:
-    legacy_modules = collect_legacy_modules()
-    if legacy_modules:
-        details = "\n".join(
-            f"{path}:{lineno} -> {reason}"
-            for path, lineno, reason in sorted(legacy_modules)
-        )
-        raise PolicyViolation("Legacy module detected:\n" + details)
-
-    legacy_configs = collect_legacy_configs()
-    if legacy_configs:
-        details = "\n".join(
-            f"{path}:{lineno} -> {reason}"
-            for path, lineno, reason in sorted(legacy_configs)
-        )
-        raise PolicyViolation("Legacy toggle detected in config:\n" + details)
+    _raise_sorted_records(
+        "Legacy module detected:\n", collect_legacy_modules(), _render_reason
+    )
+    _raise_sorted_records(
+        "Legacy toggle detected in config:\n", collect_legacy_configs(), _render_reason
+    )
 
 
 def _check_sync_calls() -> None:
-    forbidden_calls = collect_forbidden_sync_calls()
-    if not forbidden_calls:
-        return
-    details = "\n".join(
-        f"{path}:{lineno} -> {reason}"
-        for path, lineno, reason in sorted(forbidden_calls)
+    _raise_sorted_records(
+        "Synchronous call policy violations detected:\n",
+        collect_forbidden_sync_calls(),
+        _render_reason,
     )
-    raise PolicyViolation("Synchronous call policy violations detected:\n" + details)
 
 
 def _check_suppressions() -> None:
-    suppressions = collect_suppressions()
-    if not suppressions:
-        return
-    details = "\n".join(
-        f"{path}:{lineno} -> suppression token '{token}' detected"
-        for path, lineno, token in sorted(suppressions)
+    _raise_sorted_records(
+        "Suppression policy violations detected:\n",
+        collect_suppressions(),
+        lambda path, lineno, token: (
+            f"{path}:{lineno} -> suppression token '{token}' detected"
+        ),
     )
-    raise PolicyViolation("Suppression policy violations detected:\n" + details)
 
 
 def _check_duplicate_functions() -> None:
@@ -22,6 +22,20 @@ from .policy_context import (
 
 MIN_GETATTR_ARGS_WITH_DEFAULT = 3
 MIN_SETDEFAULT_ARGS = 2
+# Last characters of every legacy suffix in either case, used as a cheap
+# pre-check before lowercasing identifiers.
+_LEGACY_SUFFIX_TAILS = frozenset(
+    tail
+    for suffix in LEGACY_SUFFIXES
+    for tail in (suffix[-1].lower(), suffix[-1].upper())
+)
+
+
+def _has_legacy_suffix(identifier: str) -> bool:
+    """Check case-insensitively whether an identifier ends with a legacy suffix."""
+    if identifier[-1:] not in _LEGACY_SUFFIX_TAILS:
+        return False
+    return identifier.lower().endswith(LEGACY_SUFFIXES)
 
 
 def _resolve_default_argument(
@@ -44,8 +58,11 @@ def _handler_is_suppressed(
     ctx: ModuleContext,
     suppression_token: str,
 ) -> bool:
-    """Check if an exception handler contains a suppression comment."""
-    return handler_contains_suppression(handler, ctx.lines or [], suppression_token)
+    """Check if an exception handler contains a suppression comment.
+
+    Source lines are only split once a handler actually needs the check.
+    """
+    return handler_contains_suppression(handler, ctx.get_lines(), suppression_token)
 
 
 def _handler_catches_broad(handler: ast.ExceptHandler) -> bool:
@@ -131,15 +148,16 @@ class LiteralFallbackVisitor(ast.NodeVisitor):  # pylint: disable=invalid-name
 
     def visit_Call(self, node: ast.Call) -> None:  # pylint: disable=invalid-name
         """Visit Call nodes to check for literal fallbacks."""
-        self._check_get_method(node)
-        self._check_getattr(node)
-        self._check_os_getenv(node)
-        self._check_setdefault(node)
+        qualname = get_call_qualname(node.func)
+        if qualname:
+            self._check_get_method(node, qualname)
+            self._check_getattr(node, qualname)
+            self._check_os_getenv(node, qualname)
+            self._check_setdefault(node, qualname)
         self.generic_visit(node)
 
-    def _check_get_method(self, node: ast.Call) -> None:
+    def _check_get_method(self, node: ast.Call, qualname: str) -> None:
         """Check for literal fallback in .get() method calls."""
-        qualname = get_call_qualname(node.func) or ""
         if not qualname.endswith(".get"):
             return
         default_arg = _resolve_default_argument(
@@ -147,13 +165,11 @@ class LiteralFallbackVisitor(ast.NodeVisitor):  # pylint: disable=invalid-name
         )
         self._maybe_record(node, default_arg, f"{qualname} literal fallback")
 
-    def _check_getattr(self, node: ast.Call) -> None:
-        qualname = get_call_qualname(node.func) or ""
+    def _check_getattr(self, node: ast.Call, qualname: str) -> None:
         if qualname == "getattr" and len(node.args) >= MIN_GETATTR_ARGS_WITH_DEFAULT:
             self._maybe_record(node, node.args[2], "getattr literal fallback")
 
-    def _check_os_getenv(self, node: ast.Call) -> None:
-        qualname = get_call_qualname(node.func) or ""
+    def _check_os_getenv(self, node: ast.Call, qualname: str) -> None:
         if qualname not in {"os.getenv", "os.environ.get"}:
             return
         default_arg = _resolve_default_argument(
@@ -161,8 +177,7 @@ class LiteralFallbackVisitor(ast.NodeVisitor):  # pylint: disable=invalid-name
         )
         self._maybe_record(node, default_arg, f"{qualname} literal fallback")
 
-    def _check_setdefault(self, node: ast.Call) -> None:
-        qualname = get_call_qualname(node.func) or ""
+    def _check_setdefault(self, node: ast.Call, qualname: str) -> None:
         if qualname.endswith(".setdefault") and len(node.args) >= MIN_SETDEFAULT_ARGS:
             self._maybe_record(node, node.args[1], f"{qualname} literal fallback")
 
@@ -234,8 +249,7 @@ class LegacyVisitor(ast.NodeVisitor):  # pylint: disable=invalid-name
         self, node: ast.Attribute
     ) -> None:
         """Visit Attribute nodes to check for legacy suffixes."""
-        attr_name = node.attr.lower()
-        if attr_name.endswith(LEGACY_SUFFIXES):
+        if _has_legacy_suffix(node.attr):
             self.records.append(
                 (self.ctx.rel_path, node.lineno, "legacy attribute access")
             )
@@ -243,14 +257,9 @@ class LegacyVisitor(ast.NodeVisitor):  # pylint: disable=invalid-name
 
     def visit_Name(self, node: ast.Name) -> None:  # pylint: disable=invalid-name
         """Visit Name nodes to check for legacy symbols."""
-        name_id = node.id.lower()
-        if name_id.endswith(LEGACY_SUFFIXES):
+        if _has_legacy_suffix(node.id):
             self.records.append(
-                (
-                    self.ctx.rel_path,
-                    getattr(node, "lineno", 0),
-                    "legacy symbol reference",
-                )
+                (self.ctx.rel_path, node.lineno, "legacy symbol reference")
             )
 
 
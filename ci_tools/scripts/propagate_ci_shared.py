@@ -6,11 +6,15 @@ After ci_shared is successfully pushed, this script copies the canonical CI file
 into all consuming repositories (api, zeus, kalshi, aws) and pushes the changes.
 """
 
+import io
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable
 
+from ci_tools.ci_runtime.models import CommandResult
 from ci_tools.ci_runtime.process import (
     get_commit_message,
     get_current_branch,
@@ -18,23 +22,44 @@ from ci_tools.ci_runtime.process import (
 )
 from ci_tools.utils.consumers import ConsumingRepo, load_consuming_repos
 
+_HEAD_BRANCH_PREFIX = "ref: refs/heads/"
+
+# Per-thread output buffer so concurrent repository updates do not interleave.
+_REPO_OUTPUT = threading.local()
+
+
+def _emit(message: str) -> None:
+    """Print a progress line to the current repository's buffer or stdout."""
+    print(message, file=getattr(_REPO_OUTPUT, "buffer", None))
+
+
+def _run_git(args: list[str], repo_path: Path, *, check: bool) -> CommandResult:
+    """Run a git command, routing anything it prints through ``_emit``."""
+    result = run_command(args, cwd=repo_path, check=check)
+    for text in (result.stdout, result.stderr):
+        if text.strip():
+            _emit(text.rstrip())
+    return result
+
 
 def _validate_repo_state(repo_path: Path, repo_name: str) -> bool:
     """Check if repo exists and auto-commit any uncommitted changes."""
     if not repo_path.exists():
-        print(f"⚠️  Repository not found: {repo_path}")
+        _emit(f"⚠️  Repository not found: {repo_path}")
         return False
 
+    # Always ask git: editing a tracked file leaves .git/index untouched, so a
+    # cache keyed on the index mtime would report a dirty tree as clean.
     result = run_command(
         ["git", "status", "--porcelain"],
         cwd=repo_path,
         check=False,
     )
     if result.stdout.strip():
-        print(f"📝 {repo_name} has uncommitted changes, committing automatically...")
+        _emit(f"📝 {repo_name} has uncommitted changes, committing automatically...")
 
         # Stage all changes
-        run_command(["git", "add", "-A"], cwd=repo_path, check=False)
+        _run_git(["git", "add", "-A"], repo_path, check=False)
 
         # Create commit message
         commit_msg = """Auto-commit before ci_shared update
@@ -51,11 +76,11 @@ Co-Authored-By: Claude <noreply@anthropic.com>"""
         )
 
         if commit_result.returncode != 0:
-            print(f"⚠️  Failed to commit changes in {repo_name}")
-            print(f"   Error: {commit_result.stderr}")
+            _emit(f"⚠️  Failed to commit changes in {repo_name}")
+            _emit(f"   Error: {commit_result.stderr}")
             return False
 
-        print(f"✓ Successfully committed changes in {repo_name}")
+        _emit(f"✓ Successfully committed changes in {repo_name}")
 
     return True
 
@@ -64,20 +89,20 @@ def _sync_repo_configs(repo_path: Path, repo_name: str, source_root: Path) -> bo
     """Copy shared configs into the consuming repo and stage changes."""
     sync_script = source_root / "scripts" / "sync_project_configs.py"
     if not sync_script.exists():
-        print(f"⚠️  Sync script missing at {sync_script}")
+        _emit(f"⚠️  Sync script missing at {sync_script}")
         return False
 
-    print("Syncing shared config files...")
+    _emit("Syncing shared config files...")
     result = run_command(
         [sys.executable, str(sync_script), str(repo_path)],
         cwd=source_root,
         check=False,
     )
     if result.returncode != 0:
-        print(f"⚠️  sync_project_configs failed for {repo_name}")
+        _emit(f"⚠️  sync_project_configs failed for {repo_name}")
         return False
 
-    print("Running tool_config_guard sync...")
+    _emit("Running tool_config_guard sync...")
     guard_result = run_command(
         [
             sys.executable,
@@ -91,21 +116,34 @@ def _sync_repo_configs(repo_path: Path, repo_name: str, source_root: Path) -> bo
         check=False,
     )
     if guard_result.returncode != 0:
-        print(f"⚠️  tool_config_guard --sync failed for {repo_name}")
+        _emit(f"⚠️  tool_config_guard --sync failed for {repo_name}")
         return False
 
-    run_command(["git", "add", "-A"], cwd=repo_path, check=True)
-    status = run_command(
-        ["git", "status", "--porcelain"],
-        cwd=repo_path,
-        check=False,
-    )
-    if not status.stdout.strip():
-        print(f"✓ {repo_name} already up to date")
+    _run_git(["git", "add", "-A"], repo_path, check=True)
+    # Everything is staged now, so an exit status of 0 means nothing changed;
+    # --quiet avoids producing the status listing just to test it for emptiness.
+    staged = _run_git(["git", "diff", "--cached", "--quiet"], repo_path, check=False)
+    if staged.returncode == 0:
+        _emit(f"✓ {repo_name} already up to date")
         return False
     return True
 
 
+def _current_branch(repo_path: Path) -> str:
+    """Return the checked-out branch, reading ``.git/HEAD`` in-process when possible.
+
+    Only symbolic refs under ``refs/heads/`` are resolved directly; worktrees,
+    submodule checkouts, and detached heads are delegated to git.
+    """
+    try:
+        head = (repo_path / ".git" / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return get_current_branch(cwd=repo_path)
+    if head.startswith(_HEAD_BRANCH_PREFIX):
+        return head.removeprefix(_HEAD_BRANCH_PREFIX)
+    return get_current_branch(cwd=repo_path)
+
+
 def _commit_and_push_update(
     repo_path: Path, repo_name: str, ci_shared_commit_msg: str
 ) -> bool:
@@ -120,17 +158,17 @@ def _commit_and_push_update(
         check=False,
     )
     if result.returncode != 0:
-        print(f"⚠️  Failed to commit shared CI updates in {repo_name}")
+        _emit(f"⚠️  Failed to commit shared CI updates in {repo_name}")
         return False
 
-    print(f"✓ Committed shared CI updates in {repo_name}")
+    _emit(f"✓ Committed shared CI updates in {repo_name}")
 
     # Get current branch name using shared utility
     try:
-        current_branch = get_current_branch(cwd=repo_path)
+        current_branch = _current_branch(repo_path)
     except subprocess.CalledProcessError:
-        print(f"⚠️  Failed to determine current branch in {repo_name}")
-        print(f"   Run 'cd {repo_path} && git push' to push manually")
+        _emit(f"⚠️  Failed to determine current branch in {repo_name}")
+        _emit(f"   Run 'cd {repo_path} && git push' to push manually")
         return False
 
     # Push with --set-upstream to handle branches without upstream configured
@@ -140,11 +178,11 @@ def _commit_and_push_update(
         check=False,
     )
     if result.returncode != 0:
-        print(f"⚠️  Failed to push shared CI updates in {repo_name}")
-        print(f"   Run 'cd {repo_path} && git push' to push manually")
+        _emit(f"⚠️  Failed to push shared CI updates in {repo_name}")
+        _emit(f"   Run 'cd {repo_path} && git push' to push manually")
         return False
 
-    print(f"✓ Pushed shared CI updates to {repo_name}")
+    _emit(f"✓ Pushed shared CI updates to {repo_name}")
     return True
 
 
@@ -158,13 +196,19 @@ def update_submodule_in_repo(
     """
     Apply the latest ci_shared files to a consuming repository.
 
+    Args:
+        repo_path: Checkout of the consuming repository.
+        ci_shared_commit_msg: Latest ci_shared commit subject, reused in the update commit.
+        display_name: Configured repository name; when omitted the directory name is used.
+        source_root: ci_shared checkout providing the sync scripts.
+
     Returns:
         True if update was successful, False if skipped or failed
     """
     repo_name = display_name or repo_path.name
-    print(f"\n{'='*70}")
-    print(f"Updating ci_shared assets in {repo_name}...")
-    print(f"{'='*70}")
+    _emit(f"\n{'='*70}")
+    _emit(f"Updating ci_shared assets in {repo_name}...")
+    _emit(f"{'='*70}")
 
     if not _validate_repo_state(repo_path, repo_name):
         return False
@@ -175,33 +219,61 @@ def update_submodule_in_repo(
     return _commit_and_push_update(repo_path, repo_name, ci_shared_commit_msg)
 
 
+def _update_with_buffered_output(
+    repo: ConsumingRepo, commit_msg: str, source_root: Path
+) -> bool:
+    """Update one repository, writing its progress output in a single block."""
+    buffer = io.StringIO()
+    _REPO_OUTPUT.buffer = buffer
+    try:
+        return update_submodule_in_repo(
+            repo.path,
+            commit_msg,
+            display_name=repo.name,
+            source_root=source_root,
+        )
+    finally:
+        _REPO_OUTPUT.buffer = None
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
 def _process_repositories(
     consuming_repos: Iterable[ConsumingRepo],
     commit_msg: str,
     source_root: Path,
 ) -> tuple[list[str], list[str], list[str]]:
-    """Process all consuming repositories and return results."""
+    """Process all consuming repositories concurrently and return results.
+
+    Each repository is updated on its own worker thread because the work is
+    dominated by blocking git and network I/O. Results are classified in the
+    configured repository order.
+    """
     updated = []
     skipped = []
     failed = []
 
-    for repo in consuming_repos:
-        repo_path = repo.path
-        repo_name = repo.name
-        try:
-            success = update_submodule_in_repo(
-                repo_path,
-                commit_msg,
-                display_name=repo_name,
-                source_root=source_root,
+    repos = list(consuming_repos)
+    with ThreadPoolExecutor(max_workers=max(len(repos), 1)) as executor:
+        futures = [
+            (
+                repo.name,
+                executor.submit(
+                    _update_with_buffered_output, repo, commit_msg, source_root
+                ),
             )
-            if success:
-                updated.append(repo_name)
-            else:
-                skipped.append(repo_name)
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            print(f"❌ Error updating {repo_name}: {e}", file=sys.stderr)
-            failed.append(repo_name)
+            for repo in repos
+        ]
+        for repo_name, future in futures:
+            try:
+                success = future.result()
+                if success:
+                    updated.append(repo_name)
+                else:
+                    skipped.append(repo_name)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                print(f"❌ Error updating {repo_name}: {e}", file=sys.stderr)
+                failed.append(repo_name)
 
     return updated, skipped, failed
 
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import argparse
 import ast
+import functools
 import sys
 from pathlib import Path
-from typing import List
+from typing import Iterable, List, Optional
 
 from ci_tools.scripts.guard_common import (
     GuardRunner,
+    ResultsCache,
     get_class_line_span,
+    map_files_parallel,
     parse_python_ast,
     relative_path,
 )
@@ -34,6 +37,11 @@ class StructureGuard(GuardRunner):
             default=100,
             help="Maximum allowed number of lines per class definition.",
         )
+        parser.add_argument(
+            "--cache",
+            type=Path,
+            help="JSON file caching per-file results; unchanged files are not re-parsed.",
+        )
 
     def scan_file(self, path: Path, args: argparse.Namespace) -> List[str]:
         """Scan a file for class size violations."""
@@ -41,18 +49,42 @@ class StructureGuard(GuardRunner):
         assert tree is not None  # parse_python_ast raises on error by default
         assert isinstance(tree, ast.Module)  # Type narrowing for tree.body access
         violations: List[str] = []
+        max_class_lines = args.max_class_lines
         for node in tree.body:
             if isinstance(node, ast.ClassDef):
                 start, end = get_class_line_span(node)
                 length = end - start + 1
-                if length > args.max_class_lines:
+                if length > max_class_lines:
                     rel_path = relative_path(path, self.repo_root)
                     violations.append(
                         f"{rel_path}:{start} class {node.name} spans {length} lines "
-                        f"(limit {args.max_class_lines})"
+                        f"(limit {max_class_lines})"
                     )
         return violations
 
+    def scan_files(self, paths: Iterable[Path], args: argparse.Namespace) -> List[str]:
+        """Scan files, reusing cached results for files that have not changed."""
+        # The pool size check and cache bookkeeping need the whole file list.
+        paths = list(paths)
+        cache_path: Optional[Path] = args.cache
+        if cache_path is None:
+            results = self._scan_each(paths, args)
+        else:
+            # Violations embed paths relative to the repo root, so it keys the cache too.
+            key = {
+                "max_class_lines": args.max_class_lines,
+                "repo_root": str(self.repo_root),
+            }
+            cache = ResultsCache(cache_path, key)
+            results = cache.scan(paths, functools.partial(self._scan_each, args=args))
+        return [violation for found in results for violation in found]
+
+    def _scan_each(
+        self, paths: List[Path], args: argparse.Namespace
+    ) -> List[List[str]]:
+        """Return per-file violations, parsing across a process pool for large trees."""
+        return map_files_parallel(functools.partial(self.scan_file, args=args), paths)
+
     def get_violations_header(self, args: argparse.Namespace) -> str:
         """Get the header for violations report."""
         return (
@@ -0,0 +1,106 @@
+"""TOML rendering helpers for the tool configuration guard.
+
+The guard only ever writes the small subset of TOML used by tool settings:
+strings, booleans, numbers, lists, and nested tables.
+"""
+
+import json
+from typing import Any
+
+
+def format_toml_key(key: str) -> str:
+    """Return TOML-safe key, quoting when required."""
+    if key and all(ch.isalnum() or ch in "-_" for ch in key):
+        return key
+    escaped = key.replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def format_toml_list(key: str, value: list, indent_str: str) -> list[str]:
+    """Format a list value as TOML."""
+    formatted_key = format_toml_key(key)
+    if len(value) == 0:
+        return [f"{indent_str}{formatted_key} = []"]
+
+    if all(isinstance(x, str) for x in value):
+        # Multi-line array
+        return [
+            f"{indent_str}{formatted_key} = [",
+            *(f'{indent_str}    "{item}",' for item in value),
+            f"{indent_str}]",
+        ]
+
+    return [f"{indent_str}{formatted_key} = {json.dumps(value)}"]
+
+
+def format_toml_value(key: str, value: Any, indent_str: str) -> list[str]:
+    """Format a single TOML value."""
+    formatted_key = format_toml_key(key)
+    if isinstance(value, dict):
+        # Nested table - skip, will be handled separately
+        return []
+    if isinstance(value, str):
+        return [f'{indent_str}{formatted_key} = "{value}"']
+    if isinstance(value, bool):
+        return [f'{indent_str}{formatted_key} = {"true" if value else "false"}']
+    if isinstance(value, (int, float)):
+        return [f"{indent_str}{formatted_key} = {value}"]
+    if isinstance(value, list):
+        return format_toml_list(key, value, indent_str)
+    return []
+
+
+def format_toml_tool_section(data: dict[str, Any], indent: int = 0) -> str:
+    """Format tool configuration data as TOML string."""
+    lines = []
+    indent_str = "  " * indent
+
+    for key, value in sorted(data.items()):
+        lines.extend(format_toml_value(key, value, indent_str))
+
+    return "\n".join(lines)
+
+
+def emit_toml_value(lines: list[str], key: str, value: Any) -> None:
+    """Append a single TOML value."""
+    formatted_key = format_toml_key(key)
+    if isinstance(value, str):
+        lines.append(f'{formatted_key} = "{value}"')
+    elif isinstance(value, bool):
+        lines.append(f'{formatted_key} = {"true" if value else "false"}')
+    elif isinstance(value, list):
+        emit_toml_list(lines, key, value)
+    else:
+        lines.append(f"{formatted_key} = {value}")
+
+
+def emit_toml_list(lines: list[str], key: str, value: list) -> None:
+    """Append a list value as TOML."""
+    formatted_key = format_toml_key(key)
+    if all(isinstance(x, str) for x in value):
+        lines.append(f"{formatted_key} = [")
+        lines.extend(f'    "{item}",' for item in value)
+        lines.append("]")
+    else:
+        lines.append(f"{formatted_key} = {value}")
+
+
+def emit_tool_section(
+    lines: list[str], tool_name: str, tool_config: dict[str, Any]
+) -> None:
+    """Append a single tool section with all its values."""
+    lines.append(f"[tool.{tool_name}]")
+    items = sorted(tool_config.items())
+
+    # Non-dict values first
+    for key, value in items:
+        if not isinstance(value, dict):
+            emit_toml_value(lines, key, value)
+
+    # Then subsections
+    for key, value in items:
+        if isinstance(value, dict):
+            header = f"[tool.{tool_name}.{key}]"
+            lines.extend(("", header, format_toml_tool_section(value)))
+
+    lines.append("")  # Blank line between tools
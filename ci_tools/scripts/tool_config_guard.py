@@ -26,11 +26,19 @@ import sys
 from pathlib import Path
 from typing import Any
 
+from ci_tools.scripts.toml_formatting import (
+    emit_tool_section,
+    format_toml_tool_section,
+)
+
 try:
     import tomllib  # Python 3.11+
 except ImportError:
     import tomli as tomllib  # type: ignore[import-not-found]  # tomli only needed for Python 3.10
 
+# Marks shared keys that the repository configuration does not define.
+_MISSING = object()
+
 
 def load_toml(path: Path) -> dict[str, Any]:
     """Load and parse a TOML file."""
@@ -91,147 +99,56 @@ def compare_configs(
 
 
 def _compare_tool_section(shared: Any, repo: Any, path: str) -> list[str]:
-    """
-    Recursively compare tool config sections.
+    """Compare tool config sections; repo may add keys but shared keys must match.
 
-    Repo can have extra keys/subsections, but all shared keys must match.
+    Nested tables are walked with an explicit stack; equal subtrees are skipped.
     """
     differences = []
-
-    if isinstance(shared, dict) and isinstance(repo, dict):
-        # Check that all shared keys exist in repo
-        for key, shared_value in shared.items():
-            if key not in repo:
-                differences.append(f"Missing configuration: [{path}.{key}]")
-            else:
-                # Recursively compare subsections
-                sub_diffs = _compare_tool_section(
-                    shared_value, repo[key], f"{path}.{key}"
-                )
-                differences.extend(sub_diffs)
-        # Note: extra keys in repo are OK (repo-specific settings allowed)
-    elif shared != repo:
-        # Leaf value comparison
-        differences.append(
-            f"Configuration mismatch: [{path}] (expected: {shared}, got: {repo})"
-        )
+    pending: list[tuple[Any, Any, tuple[str, ...]]] = [(shared, repo, (path,))]
+
+    while pending:
+        shared_value, repo_value, key_path = pending.pop()
+        if repo_value is _MISSING:
+            differences.append(f"Missing configuration: [{'.'.join(key_path)}]")
+        elif shared_value == repo_value:
+            continue
+        elif isinstance(shared_value, dict) and isinstance(repo_value, dict):
+            # Reversed so keys pop off the stack in their original order.
+            # Note: extra keys in repo are OK (repo-specific settings allowed)
+            pending.extend(
+                (value, repo_value.get(key, _MISSING), (*key_path, key))
+                for key, value in reversed(shared_value.items())
+            )
+        else:
+            # Leaf value comparison
+            differences.append(
+                f"Configuration mismatch: [{'.'.join(key_path)}] "
+                f"(expected: {shared_value}, got: {repo_value})"
+            )
 
     return differences
 
 
-def _format_toml_key(key: str) -> str:
-    """Return TOML-safe key, quoting when required."""
-    if key and all(ch.isalnum() or ch in "-_" for ch in key):
-        return key
-    escaped = key.replace('"', '\\"')
-    return f'"{escaped}"'
-
-
-def _format_toml_list(key: str, value: list, indent_str: str) -> list[str]:
-    """Format a list value as TOML."""
-    import json  # pylint: disable=import-outside-toplevel
-
-    formatted_key = _format_toml_key(key)
-    if len(value) == 0:
-        return [f"{indent_str}{formatted_key} = []"]
-
-    if all(isinstance(x, str) for x in value):
-        # Multi-line array
-        lines = [f"{indent_str}{formatted_key} = ["]
-        for item in value:
-            lines.append(f'{indent_str}    "{item}",')
-        lines.append(f"{indent_str}]")
-        return lines
-
-    return [f"{indent_str}{formatted_key} = {json.dumps(value)}"]
-
-
-def _format_toml_value(key: str, value: Any, indent_str: str) -> list[str]:
-    """Format a single TOML value."""
-    formatted_key = _format_toml_key(key)
-    if isinstance(value, dict):
-        # Nested table - skip, will be handled separately
-        return []
-    if isinstance(value, str):
-        return [f'{indent_str}{formatted_key} = "{value}"']
-    if isinstance(value, bool):
-        return [f'{indent_str}{formatted_key} = {"true" if value else "false"}']
-    if isinstance(value, (int, float)):
-        return [f"{indent_str}{formatted_key} = {value}"]
-    if isinstance(value, list):
-        return _format_toml_list(key, value, indent_str)
-    return []
-
-
-def format_toml_tool_section(data: dict[str, Any], indent: int = 0) -> str:
-    """Format tool configuration data as TOML string."""
-    lines = []
-    indent_str = "  " * indent
-
-    for key, value in sorted(data.items()):
-        lines.extend(_format_toml_value(key, value, indent_str))
-
-    return "\n".join(lines)
-
-
-def _print_toml_value(key: str, value: Any) -> None:
-    """Print a single TOML value."""
-    formatted_key = _format_toml_key(key)
-    if isinstance(value, str):
-        print(f'{formatted_key} = "{value}"')
-    elif isinstance(value, bool):
-        print(f'{formatted_key} = {"true" if value else "false"}')
-    elif isinstance(value, list):
-        _print_toml_list(key, value)
-    else:
-        print(f"{formatted_key} = {value}")
-
-
-def _print_toml_list(key: str, value: list) -> None:
-    """Print a list value as TOML."""
-    formatted_key = _format_toml_key(key)
-    if all(isinstance(x, str) for x in value):
-        print(f"{formatted_key} = [")
-        for item in value:
-            print(f'    "{item}",')
-        print("]")
-    else:
-        print(f"{formatted_key} = {value}")
-
-
-def _print_tool_section(tool_name: str, tool_config: dict[str, Any]) -> None:
-    """Print a single tool section with all its values."""
-    print(f"[tool.{tool_name}]")
-
-    # Print non-dict values first
-    for key, value in sorted(tool_config.items()):
-        if not isinstance(value, dict):
-            _print_toml_value(key, value)
-
-    # Print subsections
-    for key, value in sorted(tool_config.items()):
-        if isinstance(value, dict):
-            print(f"\n[tool.{tool_name}.{key}]")
-            print(format_toml_tool_section(value))
-
-    print()  # Blank line between tools
-
-
 def print_tool_config_diff(
     shared_data: dict[str, Any],
     repo_data: dict[str, Any],  # pylint: disable=unused-argument
 ) -> None:
     """Print the tool configuration that should be in pyproject.toml."""
-    print("\n" + "=" * 70)
-    print("Expected tool configuration (copy to pyproject.toml):")
-    print("=" * 70 + "\n")
-
-    if "tool" not in shared_data:
-        return
-
-    shared_tools = shared_data["tool"]
-    for tool_name in sorted(shared_tools.keys()):
-        _print_tool_section(tool_name, shared_tools[tool_name])
+    lines = [
+        "",
+        "=" * 70,
+        "Expected tool configuration (copy to pyproject.toml):",
+        "=" * 70,
+        "",
+    ]
+
+    if "tool" in shared_data:
+        shared_tools = shared_data["tool"]
+        for tool_name in sorted(shared_tools.keys()):
+            emit_tool_section(lines, tool_name, shared_tools[tool_name])
+
+    # One write for the whole listing rather than a print per line.
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _remove_tool_sections(pyproject_text: str, managed_tools: set[str]) -> str:
@@ -12,6 +12,9 @@ Whitelist support:
 - Default whitelist location: .unused_module_guard_whitelist
 - Format: One relative path per line, # for comments
 
+Use --cache PATH to keep per-file imports between runs; files whose mtime and
+size are unchanged are not re-parsed.
+
 Usage:
     python -m ci_tools.scripts.unused_module_guard --root src [--strict] [--whitelist PATH]
 
@@ -21,9 +24,10 @@ Exit codes:
 """
 
 import argparse
+import re
 import sys
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Iterable, List, Optional, Pattern, Sequence, Set, Tuple
 
 from ci_tools.scripts.cli_detection import is_cli_entry_point
 from ci_tools.scripts.duplicate_detection import find_suspicious_duplicates
@@ -32,22 +36,31 @@ from ci_tools.scripts.import_analysis import (
     collect_all_imports_with_parent,
     get_module_name,
 )
-from ci_tools.scripts.import_checking import module_is_imported
+from ci_tools.scripts.import_checking import ImportIndex, module_is_imported
+
+
+def build_skip_pattern(exclude_patterns: Iterable[str]) -> Pattern[str]:
+    """Compile ``__pycache__`` and the substring exclude patterns into one regex."""
+    return re.compile("|".join(map(re.escape, ("__pycache__", *exclude_patterns))))
 
 
-def should_skip_file(py_file: Path, exclude_patterns: List[str]) -> bool:
+def should_skip_file(py_file: Path, skip_pattern: Pattern[str]) -> bool:
     """Check if a file should be skipped during unused module detection."""
-    if "__pycache__" in str(py_file):
-        return True
-    if any(pattern in str(py_file) for pattern in exclude_patterns):
-        return True
     if py_file.name in ("__main__.py", "main.py"):
         return True
+    if skip_pattern.search(str(py_file)):
+        return True
     return is_cli_entry_point(py_file)
 
 
-def find_unused_modules(
-    root: Path, exclude_patterns: Optional[List[str]] = None
+def find_unused_modules(  # pylint: disable=too-many-arguments
+    root: Path,
+    exclude_patterns: Optional[List[str]] = None,
+    jobs: Optional[int] = None,
+    *,
+    py_files: Optional[Sequence[Path]] = None,
+    parent_files: Optional[Sequence[Path]] = None,
+    cache_path: Optional[Path] = None,
 ) -> List[Tuple[Path, str]]:
     """
     Find Python modules that are never imported.
@@ -55,20 +68,34 @@ def find_unused_modules(
     Args:
         root: Root directory to search
         exclude_patterns: Patterns to exclude (e.g., ['__init__.py', 'test_'])
+        jobs: Worker processes for import collection; None uses every CPU
+        py_files: Files already found under root, to avoid walking it again
+        parent_files: Files already found under root's parent, likewise
+        cache_path: JSON file caching per-file imports between runs
 
     Returns:
         List of (file_path, reason) tuples for unused modules
     """
-    exclude_patterns = list(exclude_patterns or [])
-    all_imports = collect_all_imports_with_parent(root)
+    skip_pattern = build_skip_pattern(exclude_patterns or [])
+    if py_files is None:
+        py_files = list(iter_python_files(root))
+    import_index = ImportIndex.build(
+        collect_all_imports_with_parent(
+            root,
+            jobs,
+            root_files=py_files,
+            parent_files=parent_files,
+            cache_path=cache_path,
+        )
+    )
     unused: List[Tuple[Path, str]] = []
 
-    for py_file in iter_python_files(root):
-        if should_skip_file(py_file, exclude_patterns):
+    for py_file in py_files:
+        if should_skip_file(py_file, skip_pattern):
             continue
 
         module_name = get_module_name(py_file, root)
-        if module_is_imported(module_name, py_file.stem, all_imports, root):
+        if module_is_imported(module_name, py_file.stem, import_index, root):
             continue
 
         unused.append((py_file, f"Never imported (module: {module_name})"))
@@ -123,6 +150,12 @@ def apply_whitelist_filtering(
     return filtered
 
 
+def _report_order(entry: Tuple[Path, str]) -> Tuple[Tuple[str, ...], str]:
+    """Sort key matching Path ordering, built once per entry rather than per compare."""
+    file_path, reason = entry
+    return file_path.parts, reason
+
+
 def report_results(
     unused: List[Tuple[Path, str]],
     duplicates: List[Tuple[Path, str]],
@@ -134,13 +167,13 @@ def report_results(
 
     if unused:
         print("\n❌ Unused modules detected (never imported):")
-        for file_path, reason in sorted(unused):
+        for file_path, reason in sorted(unused, key=_report_order):
             print(f"  - {file_path.relative_to(root)}: {reason}")
         issues_found = True
 
     if duplicates:
         print("\n⚠️  Suspicious duplicate files detected:")
-        for file_path, reason in sorted(duplicates):
+        for file_path, reason in sorted(duplicates, key=_report_order):
             print(f"  - {file_path.relative_to(root)}: {reason}")
         if strict:
             issues_found = True
@@ -185,6 +218,16 @@ def main() -> int:
         ),
         default=Path(".unused_module_guard_whitelist"),
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Worker processes for parsing imports (initial: one per CPU; 1 = serial)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        help="JSON file caching per-file imports; unchanged files are not re-parsed.",
+    )
     parser.set_defaults(root=Path("src"), exclude=["__init__.py", "conftest.py"])
 
     args = parser.parse_args()
@@ -195,9 +238,20 @@ def main() -> int:
 
     print(f"Checking for unused modules in {args.root}...")
 
-    unused = find_unused_modules(args.root, args.exclude)
+    # Each tree is walked once and shared between both checks. The root gets its
+    # own walk because the parent walk does not follow a symlinked root.
+    root_files = list(iter_python_files(args.root))
+    parent_files = list(iter_python_files(args.root.parent))
+    unused = find_unused_modules(
+        args.root,
+        args.exclude,
+        args.jobs,
+        py_files=root_files,
+        parent_files=parent_files,
+        cache_path=args.cache,
+    )
     unused = apply_whitelist_filtering(unused, args.whitelist, args.root)
-    duplicates = find_suspicious_duplicates(args.root)
+    duplicates = find_suspicious_duplicates(args.root, py_files=root_files)
     duplicates = apply_whitelist_filtering(duplicates, args.whitelist, args.root)
     issues_found = report_results(unused, duplicates, args.root, args.strict)
 
@@ -71,7 +71,14 @@ def _bootstrap_shared_ci_tools() -> None:
     if shared_path not in sys.path:
         sys.path.insert(0, shared_path)
 
-    shared_module = _load_shared_package(shared_ci_tools)
+    # A reload of this shim finds the shared package already in place; mirror it
+    # instead of executing its __init__ a second time.
+    existing = sys.modules.get("ci_tools")
+    shared_init = os.fspath(shared_ci_tools / "__init__.py")
+    if existing is not None and getattr(existing, "__file__", None) == shared_init:
+        shared_module = existing
+    else:
+        shared_module = _load_shared_package(shared_ci_tools)
 
     # Mirror key module attributes so downstream imports behave identically.
     globals().update(shared_module.__dict__)
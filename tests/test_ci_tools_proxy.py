@@ -0,0 +1,70 @@
+"""Unit tests for the ci_tools_proxy shim."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from unittest.mock import patch
+
+import pytest
+
+PROXY_INIT = Path(__file__).resolve().parents[1] / "ci_tools_proxy" / "__init__.py"
+
+
+def _load_proxy(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[ModuleType, Path]:
+    """Execute the proxy shim against a minimal shared checkout under ``tmp_path``.
+
+    Returns the proxy module and the shared ``__init__.py`` it mirrors.
+    """
+    shared_init = tmp_path.resolve() / "ci_tools" / "__init__.py"
+    shared_init.parent.mkdir()
+    shared_init.write_text('SOURCE = "shared"\n')
+    monkeypatch.setenv("CI_SHARED_ROOT", str(tmp_path))
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    monkeypatch.delitem(sys.modules, "ci_tools", raising=False)
+
+    spec = importlib.util.spec_from_file_location("ci_tools_proxy", PROXY_INIT)
+    assert spec is not None and spec.loader is not None
+    proxy = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(proxy)
+    assert proxy.__file__ == os.fspath(shared_init)
+    return proxy, shared_init
+
+
+def _seed_ci_tools(monkeypatch: pytest.MonkeyPatch, module_file: Path) -> None:
+    """Install a stand-in ``ci_tools`` module loaded from ``module_file``."""
+    seeded = ModuleType("ci_tools")
+    seeded.__file__ = os.fspath(module_file)
+    seeded.SOURCE = "seeded"  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "ci_tools", seeded)
+
+
+def test_bootstrap_reuses_loaded_shared_package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test a shared package already in sys.modules is mirrored, not executed again."""
+    proxy, shared_init = _load_proxy(tmp_path, monkeypatch)
+    _seed_ci_tools(monkeypatch, shared_init)
+
+    with patch.object(proxy, "_load_shared_package") as mock_load:
+        proxy._bootstrap_shared_ci_tools()  # pylint: disable=protected-access
+
+    mock_load.assert_not_called()
+    assert proxy.SOURCE == "seeded"
+
+
+def test_bootstrap_loads_package_when_loaded_module_is_elsewhere(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test a ci_tools module from another location is replaced by the shared one."""
+    proxy, shared_init = _load_proxy(tmp_path, monkeypatch)
+    _seed_ci_tools(monkeypatch, shared_init.parent.parent / "elsewhere" / "__init__.py")
+
+    load = proxy._load_shared_package  # pylint: disable=protected-access
+    with patch.object(proxy, "_load_shared_package", wraps=load) as mock_load:
+        proxy._bootstrap_shared_ci_tools()  # pylint: disable=protected-access
+
+    mock_load.assert_called_once_with(shared_init.parent)
+    assert proxy.SOURCE == "shared"
+    assert sys.modules["ci_tools"].__file__ == os.fspath(shared_init)
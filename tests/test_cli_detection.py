@@ -2,133 +2,14 @@
 
 from __future__ import annotations
 
+import ast
+import textwrap
 from pathlib import Path
 
-from conftest import write_module
-from ci_tools.scripts.cli_detection import (
-    has_class_main_call,
-    has_main_function,
-    has_main_guard,
-    is_cli_entry_point,
-)
-from ci_tools.scripts.guard_common import parse_python_ast
-
-
-def test_has_main_function_present(tmp_path: Path):
-    """Test has_main_function detects main() function."""
-    py_file = tmp_path / "script.py"
-    write_module(
-        py_file,
-        """
-        def main():
-            pass
-        """,
-    )
-    tree = parse_python_ast(py_file)
-    assert tree is not None
-    assert has_main_function(tree)
-
-
-def test_has_main_function_absent(tmp_path: Path):
-    """Test has_main_function returns False when no main()."""
-    py_file = tmp_path / "module.py"
-    write_module(
-        py_file,
-        """
-        def foo():
-            pass
-        """,
-    )
-    tree = parse_python_ast(py_file)
-    assert tree is not None
-    assert not has_main_function(tree)
-
-
-def test_has_main_guard_present(tmp_path: Path):
-    """Test has_main_guard detects if __name__ == '__main__'."""
-    py_file = tmp_path / "script.py"
-    write_module(
-        py_file,
-        """
-        if __name__ == '__main__':
-            main()
-        """,
-    )
-    tree = parse_python_ast(py_file)
-    assert tree is not None
-    assert has_main_guard(tree)
-
-
-def test_has_main_guard_absent(tmp_path: Path):
-    """Test has_main_guard returns False when no guard."""
-    py_file = tmp_path / "module.py"
-    write_module(
-        py_file,
-        """
-        def foo():
-            pass
-        """,
-    )
-    tree = parse_python_ast(py_file)
-    assert tree is not None
-    assert not has_main_guard(tree)
+import pytest
 
-
-def test_has_class_main_call_with_sys_exit(tmp_path: Path):
-    """Test has_class_main_call detects sys.exit(ClassName.main())."""
-    py_file = tmp_path / "guard.py"
-    write_module(
-        py_file,
-        """
-        import sys
-
-        class MyGuard:
-            @staticmethod
-            def main():
-                return 0
-
-        if __name__ == '__main__':
-            sys.exit(MyGuard.main())
-        """,
-    )
-    tree = parse_python_ast(py_file)
-    assert tree is not None
-    assert has_class_main_call(tree)
-
-
-def test_has_class_main_call_without_sys_exit(tmp_path: Path):
-    """Test has_class_main_call detects direct ClassName.main()."""
-    py_file = tmp_path / "guard.py"
-    write_module(
-        py_file,
-        """
-        class MyGuard:
-            @staticmethod
-            def main():
-                return 0
-
-        if __name__ == '__main__':
-            MyGuard.main()
-        """,
-    )
-    tree = parse_python_ast(py_file)
-    assert tree is not None
-    assert has_class_main_call(tree)
-
-
-def test_has_class_main_call_absent(tmp_path: Path):
-    """Test has_class_main_call returns False when no class main call."""
-    py_file = tmp_path / "module.py"
-    write_module(
-        py_file,
-        """
-        if __name__ == '__main__':
-            print('hello')
-        """,
-    )
-    tree = parse_python_ast(py_file)
-    assert tree is not None
-    assert not has_class_main_call(tree)
+from conftest import write_module
+from ci_tools.scripts.cli_detection import has_entry_point_pattern, is_cli_entry_point
 
 
 def test_is_cli_entry_point_module_level_main(tmp_path: Path):
@@ -214,3 +95,25 @@ def test_is_cli_entry_point_invalid_file(tmp_path: Path):
     py_file = tmp_path / "bad.py"
     py_file.write_text('def broken(\n', encoding='utf-8')
     assert not is_cli_entry_point(py_file)
+
+
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    [
+        ("def main():\n    pass\nif __name__ == '__main__':\n    main()\n", True),
+        ("class Tool:\n    pass\nif __name__ == '__main__':\n    sys.exit(Tool.main())\n", True),
+        ("class Tool:\n    pass\nif __name__ == '__main__':\n    Tool.main()\n", True),
+        ("if __name__ == '__main__':\n    print('hi')\n", False),
+        ("def main():\n    pass\n", False),
+        (
+            "class Tool:\n    def main(self):\n        pass\n"
+            "if __name__ == '__main__':\n    run()\n",
+            True,
+        ),
+        ("def foo():\n    pass\n", False),
+        ("x = 1\n", False),
+    ],
+)
+def test_has_entry_point_pattern(source: str, expected: bool):
+    """Test a main() plus __main__ guard, or a guard calling *.main(), is an entry point."""
+    assert has_entry_point_pattern(ast.parse(textwrap.dedent(source))) is expected
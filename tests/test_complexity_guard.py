@@ -5,6 +5,7 @@ from __future__ import annotations
 import sys
 import textwrap
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -31,6 +32,45 @@ def test_calculate_cognitive_complexity_counts_nested_branches() -> None:
     assert score >= get_constant("complexity_guard", "min_score")
 
 
+NESTED_SOURCE = """
+def sample(x):
+    if x > 10:
+        for v in range(x):
+            if v % 2 == 0 and v > 3 or v < 1:
+                return v
+    elif x < 0:
+        while x:
+            x += 1
+    else:
+        try:
+            pass
+        except ValueError:
+            if x:
+                pass
+    return 0
+"""
+
+LAMBDA_SOURCE = """
+async def sample(items):
+    key = lambda i: (i if i and i > 0 else 0) or -1
+    async for item in items:
+        if item:
+            def inner():
+                if item or key:
+                    return 1
+            return inner
+    with open("x") as fh:
+        return [y for y in fh if y and not y]
+"""
+
+
+@pytest.mark.parametrize(("source", "expected"), [(NESTED_SOURCE, 20), (LAMBDA_SOURCE, 5)])
+def test_calculate_cognitive_complexity_scores(source: str, expected: int) -> None:
+    """Test exact scores for nesting, boolean chains, lambdas and inner functions."""
+    func = complexity_guard.ast.parse(source).body[0]
+    assert complexity_guard.calculate_cognitive_complexity(func) == expected
+
+
 def test_check_file_complexity_detects_violation(tmp_path: Path) -> None:
     """Test that complexity violations are detected in files."""
     target = tmp_path / "violations.py"
@@ -64,6 +104,186 @@ def test_check_file_complexity_ignores_simple_function(tmp_path: Path) -> None:
     assert not results
 
 
+def test_check_file_complexity_honours_coding_cookie(tmp_path: Path) -> None:
+    """Test non-UTF-8 sources with a coding declaration are still checked."""
+    target = tmp_path / "latin.py"
+    source = (
+        "# -*- coding: latin-1 -*-\n"
+        "def branchy(value: int) -> str:\n"
+        "    if value > 0:\n"
+        "        return 'caf\u00e9'\n"
+        "    return ''\n"
+    )
+    target.write_bytes(source.encode("latin-1"))
+
+    results = complexity_guard.check_file_complexity(target, max_cyclomatic=1, max_cognitive=5)
+    assert [result.function_name for result in results] == ["branchy"]
+
+
+def test_check_file_complexity_warns_on_undecodable_source(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test invalid bytes are reported as unparseable instead of raising."""
+    target = tmp_path / "broken.py"
+    target.write_bytes(b"x = '\xff'\n")
+
+    assert not complexity_guard.check_file_complexity(target, max_cyclomatic=1, max_cognitive=1)
+    assert "Could not parse" in capsys.readouterr().err
+
+
+def test_check_file_complexity_scores_same_named_methods_separately(tmp_path: Path) -> None:
+    """Test methods sharing a name each get their own cognitive score."""
+    target = tmp_path / "runners.py"
+    write_module(
+        target,
+        """
+        class Branchy:
+            @staticmethod
+            def run(value: int) -> int:
+                if value > 0:
+                    if value > 1:
+                        return value
+                return 0
+
+
+        class Flat:
+            def run(self) -> int:
+                return 1
+        """,
+    )
+    results = complexity_guard.check_file_complexity(target, max_cyclomatic=0, max_cognitive=100)
+    scores = {(result.function_name, result.line_number): result.cognitive for result in results}
+
+    assert scores[("run", 3)] == 3
+    assert scores[("run", 11)] == 0
+
+
+def test_check_file_complexity_scores_closures_with_their_enclosing_function(
+    tmp_path: Path,
+) -> None:
+    """Test closures are scored as part of the reported function, not on their own."""
+    target = tmp_path / "closures.py"
+    write_module(
+        target,
+        """
+        def outer(value):
+            def inner():
+                if value:
+                    return 1
+                return 0
+            return inner
+
+        if True:
+            async def guarded(value):
+                if value:
+                    return 1
+                return 0
+
+        class Service:
+            def method(self, value):
+                def helper():
+                    if value:
+                        if value > 1:
+                            return 2
+                    return 0
+                return helper
+        """,
+    )
+    results = complexity_guard.check_file_complexity(target, max_cyclomatic=0, max_cognitive=100)
+    scores = {(result.function_name, result.line_number): result.cognitive for result in results}
+
+    assert scores == {("outer", 1): 1, ("guarded", 9): 1, ("Service", 14): 0, ("method", 15): 3}
+
+
+def test_check_file_complexity_parses_once(tmp_path: Path) -> None:
+    """Test radon and the cognitive visitor share a single parse of the file."""
+    target = tmp_path / "module.py"
+    write_module(
+        target,
+        """
+        def branchy(value: int) -> int:
+            if value > 0:
+                return value
+            return 0
+        """,
+    )
+    parse = complexity_guard.ast.parse
+    with patch.object(complexity_guard.ast, "parse", wraps=parse) as mock_parse:
+        results = complexity_guard.check_file_complexity(target, max_cyclomatic=1, max_cognitive=0)
+
+    assert mock_parse.call_count == 1
+    assert [(result.cyclomatic, result.cognitive) for result in results] == [(2, 1)]
+
+
+def test_scan_files_parallel_matches_serial(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the process pool returns the same violations, in file order."""
+    paths = []
+    for index in range(3):
+        target = tmp_path / f"module_{index}.py"
+        write_module(
+            target,
+            f"""
+            def branchy_{index}(value: int) -> int:
+                if value > 0:
+                    if value > 1:
+                        return value
+                return 0
+            """,
+        )
+        paths.append(target)
+
+    serial = complexity_guard.scan_files(paths, max_cyclomatic=1, max_cognitive=1)
+    monkeypatch.setattr("ci_tools.scripts.guard_scan.PARALLEL_MIN_FILES", 1)
+    parallel = complexity_guard.scan_files(paths, max_cyclomatic=1, max_cognitive=1)
+
+    assert parallel == serial
+    assert [violation.function_name for violation in parallel] == [
+        "branchy_0",
+        "branchy_1",
+        "branchy_2",
+    ]
+
+
+def test_scan_files_cache_is_keyed_on_limits(tmp_path: Path) -> None:
+    """Test results cached under other limits are rescanned, not reused."""
+    target = tmp_path / "module.py"
+    write_module(
+        target,
+        """
+        def branchy(value: int) -> int:
+            if value > 0:
+                return value
+            return 0
+        """,
+    )
+    cache = tmp_path / "complexity.json"
+
+    assert complexity_guard.scan_files(
+        [target], max_cyclomatic=1, max_cognitive=5, cache_path=cache
+    )
+    assert not complexity_guard.scan_files(
+        [target], max_cyclomatic=5, max_cognitive=5, cache_path=cache
+    )
+
+
+def test_scan_files_rescans_after_scoring_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test results cached by an older scoring version are not served."""
+    target = tmp_path / "module.py"
+    write_module(target, "def clean() -> int:\n    return 1\n")
+    cache = tmp_path / "complexity.json"
+    complexity_guard.scan_files([target], max_cyclomatic=10, max_cognitive=15, cache_path=cache)
+
+    monkeypatch.setattr(complexity_guard, "SCORING_VERSION", complexity_guard.SCORING_VERSION + 1)
+    check = complexity_guard.check_file_complexity
+    with patch.object(complexity_guard, "check_file_complexity", wraps=check) as mock_check:
+        complexity_guard.scan_files([target], max_cyclomatic=10, max_cognitive=15, cache_path=cache)
+    assert mock_check.call_count == 1
+
+
 def run_main(monkeypatch: pytest.MonkeyPatch, args: list[str]) -> int:
     """Helper to run the main function with specified arguments."""
     monkeypatch.setattr(sys, "argv", ["complexity_guard.py", *args])
@@ -125,3 +345,55 @@ def test_main_succeeds_without_violations(
     assert code == 0
     captured = capsys.readouterr()
     assert "All functions meet complexity limits" in captured.out
+
+
+def test_main_skips_excluded_directories(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that files under an --exclude directory are never checked."""
+    root = tmp_path / "pkg"
+    (root / "generated").mkdir(parents=True)
+    write_module(root / "ok.py", "def ok() -> int:\n    return 1\n")
+    write_module(
+        root / "generated" / "bad.py",
+        """
+        def bad(value: int) -> int:
+            if value > 0:
+                return value
+            return 0
+        """,
+    )
+    code = run_main(
+        monkeypatch,
+        ["--root", str(root), "--max-cyclomatic", "1", "--exclude", "generated"],
+    )
+    assert code == 0
+    captured = capsys.readouterr()
+    assert "All functions meet complexity limits" in captured.out
+
+
+def test_report_violations_writes_grouped_report_once(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test the report groups by file, orders by line and is written in one call."""
+    violations = [
+        complexity_guard.ComplexityViolation("b.py", "late", 20, 12, 3, "cyclomatic 12"),
+        complexity_guard.ComplexityViolation("a.py", "only", 5, 11, 2, "cyclomatic 11"),
+        complexity_guard.ComplexityViolation("b.py", "early", 2, 3, 16, "cognitive 16"),
+    ]
+    with patch.object(sys.stdout, "write", wraps=sys.stdout.write) as mock_write:
+        with pytest.raises(SystemExit) as exc:
+            complexity_guard.report_violations(violations, max_cyclomatic=10, max_cognitive=15)
+
+    assert exc.value.code == 1
+    assert mock_write.call_count == 1
+    assert capsys.readouterr().out == (
+        "Complexity violations detected (cyclomatic ≤10, cognitive ≤15):\n"
+        "\n"
+        "a.py:\n"
+        "  - Line 5: only (cyclomatic=11, cognitive=2)\n"
+        "\n"
+        "b.py:\n"
+        "  - Line 2: early (cyclomatic=3, cognitive=16)\n"
+        "  - Line 20: late (cyclomatic=12, cognitive=3)\n"
+        "\n"
+        "Total: 3 function(s) exceed complexity limits\n"
+    )
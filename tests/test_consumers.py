@@ -46,6 +46,15 @@ def test_load_from_config_with_strings(tmp_path: Path):
     assert repos[0].path == (tmp_path.parent / "alpha").resolve()
 
 
+def test_load_from_config_with_utf8_bom(tmp_path: Path):
+    """Test a config file saved with a UTF-8 byte order mark still loads."""
+    (tmp_path / "ci_shared.config.json").write_text(
+        '{"consuming_repositories": ["alpha"]}', encoding="utf-8-sig"
+    )
+    repos = load_consuming_repos(tmp_path)
+    assert [repo.name for repo in repos] == ["alpha"]
+
+
 def test_load_from_env_override(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     """Test that environment variable overrides the config file."""
     write_config(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import pytest
 
 from ci_tools.ci_runtime.coverage import (
     _find_coverage_table,
@@ -11,7 +12,11 @@ from ci_tools.ci_runtime.coverage import (
 from ci_tools.ci_runtime.models import CoverageCheckResult, CoverageDeficit
 from ci_tools.test_constants import get_constant
 
-COVERAGE_CONSTANTS = get_constant("coverage")
+THRESHOLD = get_constant("coverage", "threshold")
+LOW_COVERAGE_PERCENT = get_constant("coverage", "low_coverage_percent")
+PARSED_PERCENTAGE = get_constant("coverage", "parsed_percentage")
+TABLE_ROW_COUNT = get_constant("coverage", "table_row_count")
+MINIMAL_TABLE_LENGTH = get_constant("coverage", "minimal_table_length")
 
 
 class TestFindCoverageTable:
@@ -52,7 +57,7 @@ class TestFindCoverageTable:
         ]
         table = _find_coverage_table(lines)
         assert table is not None
-        assert len(table) == COVERAGE_CONSTANTS["table_row_count"]
+        assert len(table) == TABLE_ROW_COUNT
         table_list = list(table)  # Convert to list to make pylint happy
         assert "file1.py" in table_list[2]
         assert "file2.py" in table_list[3]
@@ -66,7 +71,7 @@ class TestFindCoverageTable:
         ]
         table = _find_coverage_table(lines)
         assert table is not None
-        assert len(table) == COVERAGE_CONSTANTS["minimal_table_length"]
+        assert len(table) == MINIMAL_TABLE_LENGTH
 
     def test_returns_none_for_header_only(self):
         """Test returns None when only header exists."""
@@ -103,119 +108,94 @@ class TestFindCoverageTable:
         # Should stop at first blank line after first header
 
 
-class TestParseCoverageEntries:
-    """Tests for _parse_coverage_entries helper function."""
-
-    def test_parses_entries_below_threshold(self):
-        """Test parses coverage entries below threshold."""
-        rows = [
+# (rows, threshold, expected (path, coverage) pairs) for _parse_coverage_entries.
+PARSE_CASES = [
+    pytest.param(
+        [
             "Name                 Stmts   Miss  Cover",
             "-----------------------------------------",
             "src/module.py          100     40    60%",
             "src/other.py           200     10    95%",
-        ]
-        deficits = _parse_coverage_entries(rows, threshold=COVERAGE_CONSTANTS["threshold"])
-        assert len(deficits) == 1
-        assert deficits[0].path == "src/module.py"
-        assert deficits[0].coverage == COVERAGE_CONSTANTS["low_coverage_percent"]
-
-    def test_ignores_entries_above_threshold(self):
-        """Test ignores entries at or above threshold."""
-        rows = [
-            "module1.py    100     10    90%",
-            "module2.py    100     20    80%",
-        ]
-        deficits = _parse_coverage_entries(rows, threshold=COVERAGE_CONSTANTS["threshold"])
-        assert len(deficits) == 0
-
-    def test_skips_separator_lines(self):
-        """Test skips separator lines with dashes."""
-        rows = [
+        ],
+        THRESHOLD,
+        [("src/module.py", LOW_COVERAGE_PERCENT)],
+        id="entries-below-threshold",
+    ),
+    pytest.param(
+        ["module1.py    100     10    90%", "module2.py    100     20    80%"],
+        THRESHOLD,
+        [],
+        id="entries-at-or-above-threshold",
+    ),
+    pytest.param(
+        [
             "Name                 Stmts   Miss  Cover",
             "-----------------------------------------",
             "file.py                100     50    50%",
-        ]
-        deficits = _parse_coverage_entries(rows, threshold=COVERAGE_CONSTANTS["threshold"])
-        assert len(deficits) == 1
-        assert deficits[0].path == "file.py"
-
-    def test_skips_total_row(self):
-        """Test skips TOTAL summary row."""
-        rows = [
-            "module.py          100     50    50%",
-            "TOTAL              100     50    50%",
-        ]
-        deficits = _parse_coverage_entries(rows, threshold=COVERAGE_CONSTANTS["threshold"])
-        assert len(deficits) == 1
-        assert deficits[0].path == "module.py"
-
-    def test_handles_paths_with_spaces(self):
-        """Test handles file paths that contain spaces."""
-        rows = [
-            "src/my module.py       100     50    50%",
-        ]
-        deficits = _parse_coverage_entries(rows, threshold=COVERAGE_CONSTANTS["threshold"])
-        assert len(deficits) == 1
-        assert "my module.py" in deficits[0].path
-
-    def test_parses_percentage_correctly(self):
-        """Test parses coverage percentage correctly."""
-        rows = [
-            "file.py    10    5    45%",
-        ]
-        deficits = _parse_coverage_entries(rows, threshold=50.0)
-        assert deficits[0].coverage == COVERAGE_CONSTANTS["parsed_percentage"]
-
-    def test_skips_malformed_rows(self):
-        """Test skips rows that don't have expected format."""
-        rows = [
-            "incomplete",
-            "only two tokens",
-            "file.py    100     50    50%",  # valid
-        ]
-        deficits = _parse_coverage_entries(rows, threshold=COVERAGE_CONSTANTS["threshold"])
-        assert len(deficits) == 1
-        assert deficits[0].path == "file.py"
-
-    def test_skips_rows_without_percentage(self):
-        """Test skips rows where coverage doesn't end with %."""
-        rows = [
-            "file.py    100     50    noPercent",
-        ]
-        deficits = _parse_coverage_entries(rows, threshold=COVERAGE_CONSTANTS["threshold"])
-        assert len(deficits) == 0
-
-    def test_handles_empty_row_list(self):
-        """Test handles empty row list."""
-        deficits = _parse_coverage_entries([], threshold=COVERAGE_CONSTANTS["threshold"])
-        assert len(deficits) == 0
-
-    def test_handles_blank_lines(self):
-        """Test handles blank lines in rows."""
-        rows = [
-            "",
-            "   ",
-            "file.py    100    50    50%",
-        ]
-        deficits = _parse_coverage_entries(rows, threshold=COVERAGE_CONSTANTS["threshold"])
-        assert len(deficits) == 1
-
-    def test_parses_float_percentages(self):
-        """Test parses float percentages correctly."""
-        rows = [
-            "file.py    100    27    72.5%",
-        ]
-        deficits = _parse_coverage_entries(rows, threshold=75.0)
-        assert len(deficits) == 1
-        assert deficits[0].coverage == 72.5
-
-    def test_handles_value_error_in_parsing(self):
-        """Test handles ValueError when parsing invalid percentage."""
-        rows = [
-            "file.py    100    50    abc%",
-        ]
-        deficits = _parse_coverage_entries(rows, threshold=COVERAGE_CONSTANTS["threshold"])
-        assert len(deficits) == 0
+        ],
+        THRESHOLD,
+        [("file.py", 50.0)],
+        id="separator-lines",
+    ),
+    pytest.param(
+        ["module.py          100     50    50%", "TOTAL              100     50    50%"],
+        THRESHOLD,
+        [("module.py", 50.0)],
+        id="total-row",
+    ),
+    pytest.param(
+        ["src/my module.py       100     50    50%"],
+        THRESHOLD,
+        [("src/my module.py", 50.0)],
+        id="path-with-spaces",
+    ),
+    pytest.param(
+        ["file.py    10    5    45%"],
+        50.0,
+        [("file.py", PARSED_PERCENTAGE)],
+        id="integer-percentage",
+    ),
+    pytest.param(
+        ["incomplete", "only two tokens", "file.py    100     50    50%"],
+        THRESHOLD,
+        [("file.py", 50.0)],
+        id="malformed-rows",
+    ),
+    pytest.param(
+        ["file.py    100     50    noPercent"],
+        THRESHOLD,
+        [],
+        id="missing-percent-sign",
+    ),
+    pytest.param([], THRESHOLD, [], id="empty-rows"),
+    pytest.param(
+        ["", "   ", "file.py    100    50    50%"],
+        THRESHOLD,
+        [("file.py", 50.0)],
+        id="blank-lines",
+    ),
+    pytest.param(
+        ["file.py    100    27    72.5%"],
+        75.0,
+        [("file.py", 72.5)],
+        id="float-percentage",
+    ),
+    pytest.param(
+        ["file.py    100    50    abc%"],
+        THRESHOLD,
+        [],
+        id="invalid-percentage",
+    ),
+]
+
+
+@pytest.mark.parametrize(("rows", "threshold", "expected"), PARSE_CASES)
+def test_parse_coverage_entries(
+    rows: list[str], threshold: float, expected: list[tuple[str, float]]
+):
+    """Test rows below the threshold become deficits and everything else is skipped."""
+    deficits = _parse_coverage_entries(rows, threshold=threshold)
+    assert [(deficit.path, deficit.coverage) for deficit in deficits] == expected
 
 
 class TestExtractCoverageDeficits:
@@ -3,19 +3,26 @@
 from __future__ import annotations
 
 import ast
+import json
+import os
 import textwrap
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from ci_tools.scripts.guard_common import (
+    ResultsCache,
     count_ast_node_lines,
     count_class_methods,
     get_class_line_span,
     is_excluded,
     iter_python_files,
+    map_files_parallel,
     parse_python_ast,
+    report_violations,
 )
+from ci_tools.scripts.guard_scan import CACHE_FORMAT_VERSION
 
 
 class TestIterPythonFiles:
@@ -53,6 +60,64 @@ class TestIterPythonFiles:
         files = list(iter_python_files(tmp_path))
         assert len(files) == 0
 
+    def test_skips_directories_named_like_modules(self, tmp_path: Path):
+        """Test iter_python_files only yields regular files ending in .py."""
+        (tmp_path / "package.py").mkdir()
+        (tmp_path / "package.py" / "inner.py").write_text("# inner")
+
+        files = list(iter_python_files(tmp_path))
+        assert files == [tmp_path / "package.py" / "inner.py"]
+
+    def test_does_not_follow_directory_symlinks(self, tmp_path: Path):
+        """Test iter_python_files does not descend into symlinked directories."""
+        real = tmp_path / "real"
+        real.mkdir()
+        (real / "module.py").write_text("# module")
+        (tmp_path / "link").symlink_to(real, target_is_directory=True)
+
+        files = list(iter_python_files(tmp_path))
+        assert files == [real / "module.py"]
+
+    def test_prunes_excluded_directories(self, tmp_path: Path, monkeypatch):
+        """Test excluded directories are skipped without being read."""
+        keep = tmp_path / "keep"
+        skip = tmp_path / "skip"
+        keep.mkdir()
+        skip.mkdir()
+        (keep / "module.py").write_text("# module")
+        (skip / "ignored.py").write_text("# ignored")
+        scanned = []
+        real_scandir = os.scandir
+
+        def _recording_scandir(path):
+            scanned.append(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", _recording_scandir)
+        files = list(iter_python_files(tmp_path, [skip]))
+        assert files == [keep / "module.py"]
+        assert str(skip) not in scanned
+
+    def test_skips_excluded_files_and_roots(self, tmp_path: Path):
+        """Test excluded files and an excluded root yield nothing."""
+        (tmp_path / "a.py").write_text("# a")
+        (tmp_path / "b.py").write_text("# b")
+
+        assert list(iter_python_files(tmp_path, [tmp_path / "a.py"])) == [tmp_path / "b.py"]
+        assert not list(iter_python_files(tmp_path, [tmp_path]))
+
+    def test_prunes_tool_and_environment_directories(self, tmp_path: Path):
+        """Test virtualenv, VCS and cache directories are not descended into."""
+        (tmp_path / "module.py").write_text("# module")
+        for name in (".venv", ".git", "node_modules", "__pycache__"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "vendored.py").write_text("# vendored")
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "kept.py").write_text("# kept")
+
+        files = sorted(iter_python_files(tmp_path))
+        assert files == [tmp_path / "build" / "kept.py", tmp_path / "module.py"]
+
 
 class TestIsExcluded:
     """Tests for is_excluded utility function."""
@@ -168,6 +233,17 @@ class TestGetClassLineSpan:  # pylint: disable=too-few-public-methods
 class TestParsePythonAst:
     """Tests for parse_python_ast utility function."""
 
+    def test_honours_encoding_cookie(self, tmp_path: Path):
+        """Test parsing a file declared in a non-UTF-8 encoding."""
+        py_file = tmp_path / "latin.py"
+        py_file.write_bytes("# -*- coding: latin-1 -*-\nname = 'caf\u00e9'\n".encode("latin-1"))
+        tree = parse_python_ast(py_file)
+        assert isinstance(tree, ast.Module)
+        assign = tree.body[0]
+        assert isinstance(assign, ast.Assign)
+        assert isinstance(assign.value, ast.Constant)
+        assert assign.value.value == "caf\u00e9"
+
     def test_valid_source(self, tmp_path: Path):
         """Test parsing valid Python source."""
         py_file = tmp_path / "test.py"
@@ -183,3 +259,97 @@ class TestParsePythonAst:
         py_file.write_text("def foo(")
         with pytest.raises(RuntimeError):
             parse_python_ast(py_file)
+
+
+class TestMapFilesParallel:
+    """Tests for map_files_parallel."""
+
+    def test_small_sets_run_in_process(self, tmp_path: Path):
+        """Test small sets call func directly, so unpicklable callables work."""
+        paths = [tmp_path / "a.py", tmp_path / "b.py"]
+        assert map_files_parallel(lambda path: path.name, paths) == ["a.py", "b.py"]
+
+    def test_pool_preserves_order(self, tmp_path: Path, monkeypatch):
+        """Test pooled results come back in the order of the paths."""
+        monkeypatch.setattr("ci_tools.scripts.guard_scan.PARALLEL_MIN_FILES", 1)
+        paths = [tmp_path / f"module_{index}.py" for index in range(5)]
+        assert map_files_parallel(os.fspath, paths, jobs=2) == [os.fspath(p) for p in paths]
+
+
+class TestResultsCache:
+    """Tests for the ResultsCache per-file results cache."""
+
+    def test_rescans_only_changed_files(self, tmp_path: Path):
+        """Test unchanged files are served from the cache and changed ones rescanned."""
+        unchanged = tmp_path / "unchanged.py"
+        edited = tmp_path / "edited.py"
+        unchanged.write_text("x = 1\n")
+        edited.write_text("y = 2\n")
+        cache = ResultsCache(tmp_path / "cache" / "results.json", {"limit": 1})
+        scanned = []
+
+        def _scan_each(paths):
+            scanned.append(paths)
+            return [[path.read_text().strip()] for path in paths]
+
+        assert cache.scan([unchanged, edited], _scan_each) == [["x = 1"], ["y = 2"]]
+        edited.write_text("y = 22\n")
+        assert cache.scan([unchanged, edited], _scan_each) == [["x = 1"], ["y = 22"]]
+        assert scanned == [[unchanged, edited], [edited]]
+
+    def test_discards_cache_saved_under_another_key(self, tmp_path: Path):
+        """Test a key change, such as new limits, invalidates every entry."""
+        module = tmp_path / "module.py"
+        module.write_text("x = 1\n")
+        cache_path = tmp_path / "results.json"
+        ResultsCache(cache_path, {"limit": 1}).scan([module], lambda paths: [["old"]])
+
+        assert not ResultsCache(cache_path, {"limit": 2}).load()
+        assert ResultsCache(cache_path, {"limit": 1}).load()
+
+    def test_failed_save_keeps_previous_cache(self, tmp_path: Path):
+        """Test an interrupted write leaves the old cache in place and no temp files."""
+        cache_path = tmp_path / "results.json"
+        cache = ResultsCache(cache_path, {"limit": 1})
+        cache.save({"a.py": ("stamp", ["kept"])})
+
+        with patch("json.dump", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                cache.save({"a.py": ("stamp", ["lost"])})
+
+        assert cache.load() == {"a.py": ("stamp", ["kept"])}
+        assert [path.name for path in tmp_path.iterdir()] == ["results.json"]
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            "not json",
+            "[]",
+            {"format": CACHE_FORMAT_VERSION, "key": None},
+            {"format": CACHE_FORMAT_VERSION + 1, "key": None, "files": {}},
+            {"format": CACHE_FORMAT_VERSION, "key": None, "files": []},
+            {"format": CACHE_FORMAT_VERSION, "key": None, "files": {"a.py": 1}},
+            {"format": CACHE_FORMAT_VERSION, "key": None, "files": {"a.py": ["s", [], 3]}},
+            {"format": CACHE_FORMAT_VERSION, "key": None, "files": {"a.py": ["s", [1]]}},
+        ],
+    )
+    def test_malformed_payload_loads_as_empty(self, tmp_path: Path, payload):
+        """Test unreadable or wrongly shaped caches yield no entries instead of raising."""
+        cache_path = tmp_path / "results.json"
+        cache_path.write_text(payload if isinstance(payload, str) else json.dumps(payload))
+
+        assert not ResultsCache(cache_path, None).load()
+
+
+class TestReportViolations:
+    """Tests for report_violations utility function."""
+
+    def test_writes_sorted_report(self, capsys):
+        """Test the header is followed by sorted, bulleted violations."""
+        report_violations(["b.py:2 late", "a.py:1 early"], "Problems:")
+        assert capsys.readouterr().err == "Problems:\n  - a.py:1 early\n  - b.py:2 late\n"
+
+    def test_no_violations_writes_nothing(self, capsys):
+        """Test nothing is written when there are no violations."""
+        report_violations([], "Problems:")
+        assert capsys.readouterr().err == ""
@@ -0,0 +1,148 @@
+"""Unit tests for import_analysis module."""
+
+from __future__ import annotations
+
+import ast
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from conftest import write_module
+from ci_tools.scripts import import_analysis
+from ci_tools.scripts.import_analysis import (
+    ImportCollector,
+    _dot_prefixes,
+    collect_all_imports,
+    collect_all_imports_with_parent,
+    load_module_ast,
+)
+
+
+def test_dot_prefixes():
+    """Test dotted prefixes are produced shortest first."""
+    assert _dot_prefixes("a.b.c") == ("a", "a.b", "a.b.c")
+    assert _dot_prefixes("single") == ("single",)
+
+
+def test_import_collector_walks_without_generic_dispatch():
+    """Test imports are collected in one flat walk, nested ones included."""
+    tree = ast.parse(
+        "import a, b.c\nfrom d import e, f\nfrom . import g\n"
+        "def func():\n    import h\n"
+        "class Klass:\n    if True:\n        from i.j import k\n"
+    )
+    collector = ImportCollector()
+
+    with patch.object(
+        ImportCollector, "generic_visit", wraps=collector.generic_visit
+    ) as mock_visit:
+        collector.visit(tree)
+
+    mock_visit.assert_not_called()
+    assert {"a", "b", "b.c", "d", "d.e", "d.f", "h", "i", "i.j", "i.j.k"} <= collector.imports
+
+
+def test_import_collector_resolves_file_module_once(tmp_path: Path):
+    """Test relative imports share one module-name computation per file."""
+    tree = ast.parse("from . import a\nfrom . import b")
+    collector = ImportCollector(file_path=tmp_path / "pkg" / "sub" / "mod.py", root=tmp_path)
+    with patch(
+        "ci_tools.scripts.import_analysis.get_module_name",
+        wraps=import_analysis.get_module_name,
+    ) as mock_name:
+        collector.visit(tree)
+
+    assert mock_name.call_count == 1
+    assert {"pkg.sub.a", "pkg.sub.b"} <= collector.imports
+
+
+def test_read_source(tmp_path: Path):
+    """Test the raw bytes used for the pre-check, and None for unreadable files."""
+    module = tmp_path / "module.py"
+    module.write_text("from . import sibling\n")
+
+    assert import_analysis.read_source(module) == b"from . import sibling\n"
+    assert import_analysis.read_source(tmp_path / "missing.py") is None
+
+
+def test_collect_all_imports_reads_each_file_once(tmp_path: Path):
+    """Test the bytes read for the pre-check are the ones handed to the parser."""
+    module = tmp_path / "module.py"
+    write_module(module, "import reads_once")
+
+    with patch.object(
+        Path, "read_bytes", autospec=True, side_effect=Path.read_bytes
+    ) as mock_read:
+        imports = collect_all_imports(tmp_path, jobs=1)
+
+    assert [call.args[0] for call in mock_read.call_args_list] == [module]
+    assert "reads_once" in imports
+
+
+def test_load_module_ast_reparses_modified_file(tmp_path: Path):
+    """Test the AST cache is invalidated when a file's mtime changes."""
+    module = tmp_path / "module.py"
+    module.write_text("x = 1")
+    first = load_module_ast(module)
+
+    module.write_text("x = 1\ny = 2")
+    stat = module.stat()
+    os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = load_module_ast(module)
+
+    assert isinstance(first, ast.Module) and isinstance(second, ast.Module)
+    assert len(first.body) == 1
+    assert len(second.body) == 2
+    assert load_module_ast(tmp_path / "missing.py") is None
+
+
+def test_collect_all_imports_parallel_matches_serial(tmp_path: Path, monkeypatch):
+    """Test the process-pool collection finds the same imports as a serial pass."""
+    for index in range(4):
+        write_module(tmp_path / f"module_{index}.py", f"import pkg_{index}.sub")
+    write_module(tmp_path / "broken.py", "def broken(")
+
+    serial = collect_all_imports(tmp_path, jobs=1)
+    monkeypatch.setattr("ci_tools.scripts.guard_scan.PARALLEL_MIN_FILES", 1)
+    parallel = collect_all_imports(tmp_path, jobs=2)
+
+    assert parallel == serial
+    assert "pkg_3.sub" in parallel
+
+
+def test_collect_all_imports_with_parent_parses_each_file_once(tmp_path: Path):
+    """Test root files are parsed once yet resolved against root and parent."""
+    parent = tmp_path
+    root = parent / "src"
+    (root / "pkg").mkdir(parents=True)
+    write_module(root / "pkg" / "__init__.py", "")
+    write_module(root / "pkg" / "a.py", "from . import b")
+    write_module(parent / "tool.py", "import os")
+
+    with patch(
+        "ci_tools.scripts.import_analysis.parse_python_ast",
+        wraps=import_analysis.parse_python_ast,
+    ) as mock_parse:
+        imports = collect_all_imports_with_parent(root, jobs=1)
+
+    parsed = [call.args[0] for call in mock_parse.call_args_list]
+    assert sorted(parsed) == sorted([root / "pkg" / "a.py", parent / "tool.py"])
+    assert {"pkg.b", "src.pkg.b", "os"} <= imports
+
+
+def test_collect_all_imports_with_parent_cache_is_keyed_on_roots(tmp_path: Path):
+    """Test imports cached under other roots are re-parsed, not reused."""
+    root = tmp_path / "src"
+    root.mkdir()
+    write_module(root / "module.py", "import alpha")
+    write_module(tmp_path / "tool.py", "import gamma")
+    cache = tmp_path / "imports.json"
+    collect_all_imports_with_parent(root, jobs=1, cache_path=cache)
+
+    other_root = tmp_path / "other"
+    other_root.mkdir()
+    with patch.object(
+        import_analysis, "load_module_ast", wraps=import_analysis.load_module_ast
+    ) as collect:
+        collect_all_imports_with_parent(other_root, jobs=1, cache_path=cache)
+    assert collect.call_count == 2
@@ -310,6 +310,25 @@ def test_collect_generic_raises(policy_root, monkeypatch: pytest.MonkeyPatch):
     assert len(results) >= 1
 
 
+def test_collect_generic_raises_fail_fast(policy_root, monkeypatch: pytest.MonkeyPatch):
+    """Test collect_generic_raises stops after the first offending file in fail-fast mode."""
+    monkeypatch.setattr("ci_tools.scripts.policy_collectors_ast.ROOT", policy_root)
+    monkeypatch.setenv("POLICY_GUARD_FAIL_FAST", "1")
+
+    src_root = policy_root / "src"
+    for name in ("first.py", "second.py"):
+        write_module(
+            src_root / name,
+            """
+            def foo():
+                raise Exception("generic error")
+            """,
+        )
+
+    results = collect_generic_raises()
+    assert len(results) == 1
+
+
 def test_collect_generic_raises_base_exception(policy_root, monkeypatch: pytest.MonkeyPatch):
     """Test collect_generic_raises finds BaseException."""
     monkeypatch.setattr("ci_tools.scripts.policy_collectors_ast.ROOT", policy_root)
@@ -455,6 +474,22 @@ def test_collect_backward_compat_blocks_name(policy_root):
     )
 
 
+def test_collect_backward_compat_blocks_name_case_insensitive(policy_root):
+    """Test collect_backward_compat_blocks matches upper-case legacy suffixes."""
+    assert_collector_finds_reason(
+        collect_backward_compat_blocks,
+        "x = VALUE_COMPAT",
+        "legacy symbol",
+        root_path=policy_root,
+    )
+
+
+def test_collect_backward_compat_blocks_ignores_plain_names(policy_root):
+    """Test collect_backward_compat_blocks ignores names without legacy suffixes."""
+    write_module(policy_root / "module.py", "x = obj.method_current(value)")
+    assert not collect_backward_compat_blocks()
+
+
 def test_collect_forbidden_sync_calls_time_sleep(policy_root, monkeypatch: pytest.MonkeyPatch):
     """Test collect_forbidden_sync_calls finds time.sleep."""
     monkeypatch.setattr("ci_tools.scripts.policy_collectors_ast.ROOT", policy_root)
@@ -540,6 +575,30 @@ def test_collect_duplicate_functions(policy_root):
     assert len(results) >= 1
 
 
+def test_collect_duplicate_functions_distinct_bodies(policy_root):
+    """Test collect_duplicate_functions does not group structurally different functions."""
+
+    write_module(
+        policy_root / "module1.py",
+        """
+        def helper(x):
+            result = x + 1
+            return result
+        """,
+    )
+
+    write_module(
+        policy_root / "module2.py",
+        """
+        def helper(y):
+            output = y * y
+            return output
+        """,
+    )
+
+    assert not collect_duplicate_functions(min_length=3)
+
+
 def test_collect_duplicate_functions_min_length(policy_root):
     """Test collect_duplicate_functions respects min_length."""
 
@@ -603,6 +662,19 @@ def test_collect_bytecode_artifacts(policy_root, monkeypatch: pytest.MonkeyPatch
     assert any("__pycache__" in path for path in results)
 
 
+def test_collect_bytecode_artifacts_prunes_pycache(policy_root, monkeypatch: pytest.MonkeyPatch):
+    """Test collect_bytecode_artifacts reports __pycache__ without its contents."""
+    monkeypatch.setattr("ci_tools.scripts.policy_collectors_ast.ROOT", policy_root)
+    pycache = policy_root / "pkg" / "__pycache__"
+    pycache.mkdir(parents=True)
+    (pycache / "module.cpython-311.pyc").write_bytes(b"fake")
+
+    results = collect_bytecode_artifacts()
+
+    assert len(results) == 1
+    assert results[0].endswith("pkg/__pycache__")
+
+
 def test_purge_bytecode_artifacts(policy_root, monkeypatch: pytest.MonkeyPatch):
     """Test purge_bytecode_artifacts removes .pyc files."""
     monkeypatch.setattr("ci_tools.scripts.policy_collectors_ast.ROOT", policy_root)
@@ -8,6 +8,8 @@ import pytest
 
 from conftest import assert_collector_finds_token, write_module
 from ci_tools.scripts.policy_collectors_text import (
+    _has_legacy_pattern,
+    _keyword_token_lines,
     collect_flagged_tokens,
     collect_legacy_configs,
     collect_legacy_modules,
@@ -86,6 +88,18 @@ def test_scan_keywords_handles_tokenize_error(policy_root):
     # Just ensure it completes without error
 
 
+def test_keyword_token_lines_ignores_strings_and_comments():
+    """Test _keyword_token_lines only reports NAME tokens."""
+    source = 'legacy = 1\n# legacy\ntext = "legacy"\n'
+    assert _keyword_token_lines(source, {"legacy": "legacy"}) == {"legacy": {1}}
+
+
+def test_keyword_token_lines_skips_file_on_mid_stream_token_error():
+    """Test a tokenize failure part-way through the file drops its hits."""
+    source = 'legacy = 1\ntext = """unterminated'
+    assert not _keyword_token_lines(source, {"legacy": "legacy"})
+
+
 def test_scan_keywords_filters_by_name_token_type(policy_root):
     """Test scan_keywords only matches NAME tokens."""
 
@@ -316,6 +330,20 @@ def test_collect_legacy_modules_compat_directory(policy_root):
     )
 
 
+@pytest.mark.parametrize(
+    ("lowered_path", "expected"),
+    [
+        ("pkg/helpers_legacy.py", True),
+        ("pkg/compat/helpers.py", True),
+        ("deprecated/helpers.py", True),
+        ("pkg/helpers.py", False),
+    ],
+)
+def test_has_legacy_pattern(lowered_path: str, expected: bool):
+    """Test _has_legacy_pattern matches suffixes, directory parts, and prefixes."""
+    assert _has_legacy_pattern(lowered_path) is expected
+
+
 def test_collect_legacy_configs_json(policy_root, monkeypatch: pytest.MonkeyPatch):
     """Test collect_legacy_configs finds legacy in JSON config."""
     monkeypatch.setattr("ci_tools.scripts.policy_collectors_text.ROOT", policy_root)
@@ -15,6 +15,7 @@ from ci_tools.scripts.policy_context import (
     BROAD_EXCEPT_SUPPRESSION,
     BROAD_EXCEPTION_NAMES,
     CONFIG_EXTENSIONS,
+    FAIL_FAST_ENV_VAR,
     FLAGGED_TOKENS,
     FORBIDDEN_SYNC_CALLS,
     FUNCTION_LENGTH_THRESHOLD,
@@ -29,6 +30,7 @@ from ci_tools.scripts.policy_context import (
     FunctionNormalizer,
     ModuleContext,
     classify_handler,
+    fail_fast_enabled,
     get_call_qualname,
     handler_contains_suppression,
     handler_has_raise,
@@ -37,6 +39,7 @@ from ci_tools.scripts.policy_context import (
     is_non_none_literal,
     iter_module_contexts,
     iter_python_files,
+    iter_until_violation,
     normalize_function,
 )
 
@@ -114,6 +117,26 @@ def test_module_context_optional_fields():
     assert ctx.lines is None
 
 
+def test_module_context_get_lines_splits_lazily():
+    """Test ModuleContext.get_lines splits source on first access and caches it."""
+    tree = ast.parse("x = 1")
+    ctx = ModuleContext(
+        path=Path("/test/file.py"),
+        rel_path="test/file.py",
+        tree=tree,
+        source="x = 1\ny = 2",
+    )
+    assert ctx.lines is None
+    assert ctx.get_lines() == ["x = 1", "y = 2"]
+    assert ctx.get_lines() is ctx.lines
+
+
+def test_module_context_get_lines_without_source():
+    """Test ModuleContext.get_lines returns an empty list when source is missing."""
+    ctx = ModuleContext(path=Path("/test/file.py"), rel_path="test/file.py", tree=ast.parse(""))
+    assert ctx.get_lines() == []
+
+
 def test_function_normalizer_visit_name():
     """Test FunctionNormalizer normalizes Name nodes."""
     source = "x = y + z"
@@ -859,3 +882,36 @@ def test_normalize_function_vararg_kwarg_annotations():
     result1 = normalize_function(stmt1)
     result2 = normalize_function(stmt2)
     assert result1 == result2
+
+
+def test_fail_fast_enabled_reads_env(monkeypatch):
+    """Test fail_fast_enabled only activates for POLICY_GUARD_FAIL_FAST=1."""
+    monkeypatch.delenv(FAIL_FAST_ENV_VAR, raising=False)
+    assert fail_fast_enabled() is False
+    monkeypatch.setenv(FAIL_FAST_ENV_VAR, "0")
+    assert fail_fast_enabled() is False
+    monkeypatch.setenv(FAIL_FAST_ENV_VAR, "1")
+    assert fail_fast_enabled() is True
+
+
+def test_iter_until_violation_stops_after_first_record(monkeypatch):
+    """Test iter_until_violation stops once records is non-empty in fail-fast mode."""
+    monkeypatch.setenv(FAIL_FAST_ENV_VAR, "1")
+    records: list[int] = []
+    seen = []
+    for item in iter_until_violation([1, 2, 3], records):
+        seen.append(item)
+        if item == 2:
+            records.append(item)
+    assert seen == [1, 2]
+
+
+def test_iter_until_violation_yields_all_without_fail_fast(monkeypatch):
+    """Test iter_until_violation yields every item when fail-fast is off."""
+    monkeypatch.delenv(FAIL_FAST_ENV_VAR, raising=False)
+    records: list[int] = []
+    seen = []
+    for item in iter_until_violation([1, 2, 3], records):
+        seen.append(item)
+        records.append(item)
+    assert seen == [1, 2, 3]
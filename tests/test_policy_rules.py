@@ -67,6 +67,15 @@ def test_enforce_occurrences_sorts_violations():
     assert a_pos < z_pos
 
 
+def test_enforce_occurrences_sorts_line_numbers_numerically():
+    """Test enforce_occurrences orders records by numeric line number."""
+    discovered = [("a.py", 10), ("a.py", 9)]
+    with pytest.raises(PolicyViolation) as exc:
+        enforce_occurrences(discovered, "issue")
+    message = str(exc.value)
+    assert message.index("a.py:9 ") < message.index("a.py:10 ")
+
+
 def test_enforce_duplicate_functions_no_duplicates():
     """Test enforce_duplicate_functions with no duplicates."""
     enforce_duplicate_functions([])
@@ -10,6 +10,7 @@ import pytest
 from ci_tools.ci_runtime.process import (
     _run_command_buffered,
     _run_command_streaming,
+    _run_command_uncaptured,
     _stream_pipe,
     run_command,
     tail_text,
@@ -231,6 +232,24 @@ class TestRunCommand:
             call_args = mock_buffered.call_args
             assert isinstance(call_args[0][0], list)
 
+    def test_uncaptured_runner_does_not_pipe_output(self):
+        """Test the child inherits the parent's streams and only the status is kept."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0)
+            result = _run_command_uncaptured(["git", "add", "-A"], check=True, env={}, cwd=None)
+            assert result == CommandResult(returncode=0, stdout="", stderr="")
+            kwargs = mock_run.call_args[1]
+            assert "stdout" not in kwargs and "stderr" not in kwargs
+            assert kwargs["check"] is True
+
+    def test_uncaptured_mode_when_capture_output_false(self):
+        """Test that output is left uncaptured when capture_output=False."""
+        with patch("ci_tools.ci_runtime.process._run_command_uncaptured") as mock_uncaptured:
+            mock_uncaptured.return_value = CommandResult(0, "", "")
+            result = run_command(["git", "add", "-A"], capture_output=False, live=True)
+            assert result.returncode == 0
+            mock_uncaptured.assert_called_once()
+
     def test_check_parameter_passed_through(self):
         """Test that check parameter is passed to runner."""
         with patch("ci_tools.ci_runtime.process._run_command_buffered") as mock_buffered:
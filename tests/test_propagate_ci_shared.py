@@ -12,6 +12,8 @@ from ci_tools.ci_runtime.models import CommandResult
 from ci_tools.ci_runtime.process import get_commit_message, run_command
 from ci_tools.scripts.propagate_ci_shared import (
     _commit_and_push_update,
+    _current_branch,
+    _emit,
     _print_summary,
     _process_repositories,
     _sync_repo_configs,
@@ -149,7 +151,7 @@ def test_validate_repo_state_clean(tmp_path):
 
 
 def test_sync_repo_configs_no_changes(tmp_path):
-    """Test _sync_repo_configs reports no updates when status clean."""
+    """Test _sync_repo_configs reports no updates when nothing is staged."""
     repo_path = tmp_path / "repo"
     repo_path.mkdir()
     source_root = tmp_path / "ci_shared"
@@ -168,7 +170,7 @@ def test_sync_repo_configs_no_changes(tmp_path):
 
 
 def test_sync_repo_configs_with_changes(tmp_path):
-    """Test _sync_repo_configs reports updates when status dirty."""
+    """Test _sync_repo_configs reports updates when changes are staged."""
     repo_path = tmp_path / "repo"
     repo_path.mkdir()
     source_root = tmp_path / "ci_shared"
@@ -180,10 +182,34 @@ def test_sync_repo_configs_with_changes(tmp_path):
             CommandResult(returncode=0, stdout="", stderr=""),
             CommandResult(returncode=0, stdout="", stderr=""),
             CommandResult(returncode=0, stdout="", stderr=""),
-            CommandResult(returncode=0, stdout=" M file\n", stderr=""),
+            CommandResult(returncode=1, stdout="", stderr=""),
         ]
         result = _sync_repo_configs(repo_path, "repo", source_root)
         assert result is True
+        assert mock_run.call_args.args[0] == ["git", "diff", "--cached", "--quiet"]
+
+
+def test_sync_repo_configs_routes_git_output_through_emit(tmp_path):
+    """Test git's own output lands in the repo's progress output, not the terminal."""
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    source_root = tmp_path / "ci_shared"
+    (source_root / "scripts").mkdir(parents=True)
+    (source_root / "scripts" / "sync_project_configs.py").write_text("print('ok')")
+
+    with patch("ci_tools.scripts.propagate_ci_shared.run_command") as mock_run, patch(
+        "ci_tools.scripts.propagate_ci_shared._emit"
+    ) as mock_emit:
+        mock_run.side_effect = [
+            CommandResult(returncode=0, stdout="", stderr=""),
+            CommandResult(returncode=0, stdout="", stderr=""),
+            CommandResult(returncode=0, stdout="", stderr="warning: LF will be replaced\n"),
+            CommandResult(returncode=1, stdout="", stderr=""),
+        ]
+        assert _sync_repo_configs(repo_path, "repo", source_root) is True
+
+    mock_emit.assert_any_call("warning: LF will be replaced")
+    assert all("capture_output" not in call.kwargs for call in mock_run.call_args_list)
 
 
 def test_commit_and_push_update_commit_failure(tmp_path):
@@ -242,6 +268,28 @@ def test_commit_and_push_update_success(tmp_path):
             assert result is True
 
 
+def test_current_branch_reads_head_file(tmp_path):
+    """Test _current_branch resolves a symbolic HEAD without running git."""
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "HEAD").write_text("ref: refs/heads/feature/x\n", encoding="utf-8")
+    with patch("ci_tools.scripts.propagate_ci_shared.get_current_branch") as mock_branch:
+        assert _current_branch(tmp_path) == "feature/x"
+        mock_branch.assert_not_called()
+
+
+def test_current_branch_delegates_for_detached_head(tmp_path):
+    """Test _current_branch asks git when HEAD is not a branch ref."""
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "HEAD").write_text("0123456789abcdef\n", encoding="utf-8")
+    with patch(
+        "ci_tools.scripts.propagate_ci_shared.get_current_branch", return_value=""
+    ) as mock_branch:
+        assert _current_branch(tmp_path) == ""
+        mock_branch.assert_called_once_with(cwd=tmp_path)
+
+
 def test_update_submodule_in_repo_invalid_state(tmp_path):
     """Test update_submodule_in_repo with invalid state."""
     repo_path = tmp_path / "repo"
@@ -282,14 +330,49 @@ def test_process_repositories(tmp_path):
         ConsumingRepo("kalshi", tmp_path / "kalshi"),
         ConsumingRepo("aws", tmp_path / "aws"),
     ]
-    with patch("ci_tools.scripts.propagate_ci_shared.update_submodule_in_repo") as mock_update:
-        mock_update.side_effect = [True, False, Exception("error")]
+    outcomes = {"zeus": True, "kalshi": False, "aws": Exception("error")}
+
+    def fake_update(_repo_path, _commit_msg, *, display_name, source_root):
+        assert source_root == tmp_path
+        outcome = outcomes[display_name]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    with patch(
+        "ci_tools.scripts.propagate_ci_shared.update_submodule_in_repo",
+        side_effect=fake_update,
+    ):
         updated, skipped, failed = _process_repositories(repos, "Test commit", tmp_path)
         assert updated == ["zeus"]
         assert skipped == ["kalshi"]
         assert failed == ["aws"]
 
 
+def test_process_repositories_buffers_output_per_repo(tmp_path, capsys):
+    """Test _process_repositories writes each repo's progress as one block."""
+    repos = [
+        ConsumingRepo("zeus", tmp_path / "zeus"),
+        ConsumingRepo("kalshi", tmp_path / "kalshi"),
+    ]
+
+    def fake_update(_repo_path, _commit_msg, *, display_name, source_root):
+        assert source_root == tmp_path
+        _emit(f"{display_name} start")
+        _emit(f"{display_name} end")
+        return True
+
+    with patch(
+        "ci_tools.scripts.propagate_ci_shared.update_submodule_in_repo",
+        side_effect=fake_update,
+    ):
+        _process_repositories(repos, "Test commit", tmp_path)
+
+    out = capsys.readouterr().out
+    assert "zeus start\nzeus end\n" in out
+    assert "kalshi start\nkalshi end\n" in out
+
+
 def test_print_summary_all_types(capsys):
     """Test _print_summary prints all status types."""
     _print_summary(["zeus"], ["kalshi"], ["aws"])
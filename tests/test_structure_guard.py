@@ -6,6 +6,8 @@ import argparse
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from conftest import write_module
 from ci_tools.scripts.structure_guard import StructureGuard
 
@@ -151,3 +153,53 @@ def test_main_with_violations(tmp_path: Path, monkeypatch):
 
     result = StructureGuard.main()
     assert result == 1
+
+
+def test_main_does_not_report_scan_errors_as_traversal(tmp_path: Path, capsys):
+    """Test an OSError from scanning one file keeps its path, not a traversal message."""
+    module = tmp_path / "module.py"
+    write_module(module, "class Small:\n    pass")
+    denied = PermissionError(13, "Permission denied", str(module))
+
+    with patch.object(StructureGuard, "scan_file", side_effect=denied):
+        with pytest.raises(PermissionError) as exc_info:
+            StructureGuard.main(["--root", str(tmp_path)])
+
+    assert exc_info.value.filename == str(module)
+    assert "failed to traverse" not in capsys.readouterr().err
+
+
+def test_scan_files_parallel_matches_serial(tmp_path: Path, monkeypatch):
+    """Test the process-pool scan reports the same violations as a serial scan."""
+    paths = []
+    for index in range(3):
+        class_lines = "\n".join(f"    x{i} = {i}" for i in range(5 + index * 10))
+        path = tmp_path / f"module_{index}.py"
+        write_module(path, f"class Class{index}:\n{class_lines}")
+        paths.append(path)
+
+    guard = StructureGuard()
+    guard.repo_root = tmp_path
+    args = argparse.Namespace(max_class_lines=10, cache=None)
+    serial = guard.scan_files(paths, args)
+
+    monkeypatch.setattr("ci_tools.scripts.guard_scan.PARALLEL_MIN_FILES", 1)
+    parallel = guard.scan_files(paths, args)
+
+    assert parallel == serial
+    assert len(parallel) == 2
+
+
+def test_scan_files_cache_is_keyed_on_repo_root(tmp_path: Path):
+    """Test results cached under another repo root are rescanned, not reused."""
+    module = tmp_path / "pkg" / "module.py"
+    module.parent.mkdir()
+    write_module(module, "class Big:\n" + "\n".join(f"    x{i} = {i}" for i in range(12)))
+
+    guard = StructureGuard()
+    guard.repo_root = tmp_path
+    args = argparse.Namespace(max_class_lines=10, cache=tmp_path / "structure.json")
+    assert guard.scan_files([module], args)[0].startswith("pkg/module.py:")
+
+    guard.repo_root = module.parent
+    assert guard.scan_files([module], args)[0].startswith("module.py:")
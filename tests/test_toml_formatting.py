@@ -0,0 +1,118 @@
+"""Unit tests for toml_formatting module."""
+
+from __future__ import annotations
+
+from ci_tools.scripts.toml_formatting import (
+    emit_tool_section,
+    emit_toml_list,
+    emit_toml_value,
+    format_toml_key,
+    format_toml_list,
+    format_toml_tool_section,
+    format_toml_value,
+)
+
+
+def test_format_toml_key_quotes_special_characters():
+    """Test format_toml_key leaves bare keys alone and quotes the rest."""
+    assert format_toml_key("line-length") == "line-length"
+    assert format_toml_key('a "b"') == '"a \\"b\\""'
+
+
+def test_format_toml_list_empty():
+    """Test format_toml_list with empty list."""
+    result = format_toml_list("key", [], "")
+    assert result == ["key = []"]
+
+
+def test_format_toml_list_strings():
+    """Test format_toml_list with string list."""
+    result = format_toml_list("select", ["E", "F"], "")
+    assert "select = [" in result[0]
+    assert any('"E"' in line for line in result)
+    assert any('"F"' in line for line in result)
+
+
+def test_format_toml_value_string():
+    """Test format_toml_value with string."""
+    result = format_toml_value("name", "test", "")
+    assert result == ['name = "test"']
+
+
+def test_format_toml_value_bool():
+    """Test format_toml_value with boolean."""
+    result = format_toml_value("enabled", True, "")
+    assert result == ["enabled = true"]
+    result = format_toml_value("enabled", False, "")
+    assert result == ["enabled = false"]
+
+
+def test_format_toml_value_number():
+    """Test format_toml_value with number."""
+    result = format_toml_value("count", 42, "")
+    assert result == ["count = 42"]
+
+
+def test_format_toml_value_list():
+    """Test format_toml_value with list."""
+    result = format_toml_value("items", ["a", "b"], "")
+    assert len(result) > 0
+
+
+def test_format_toml_value_dict():
+    """Test format_toml_value with dict returns empty."""
+    result = format_toml_value("section", {}, "")
+    assert not result
+
+
+def test_format_toml_tool_section():
+    """Test format_toml_tool_section formats config."""
+    data = {"line-length": 100, "enabled": True}
+    result = format_toml_tool_section(data)
+    assert "line-length = 100" in result
+    assert "enabled = true" in result
+
+
+def test_format_toml_tool_section_quotes_special_keys():
+    """Keys requiring quoting should be quoted."""
+    data = {"tests/**": ["TRY002"]}
+    result = format_toml_tool_section(data)
+    assert '"tests/**"' in result
+
+
+def test_emit_toml_value_string():
+    """Test emit_toml_value with string."""
+    lines = []
+    emit_toml_value(lines, "name", "test")
+    assert lines == ['name = "test"']
+
+
+def test_emit_toml_value_bool():
+    """Test emit_toml_value with boolean."""
+    lines = []
+    emit_toml_value(lines, "enabled", True)
+    assert lines == ["enabled = true"]
+
+
+def test_emit_toml_value_list():
+    """Test emit_toml_value with list."""
+    lines = []
+    emit_toml_value(lines, "items", ["a", "b"])
+    assert "items = [" in lines
+
+
+def test_emit_toml_list_strings():
+    """Test emit_toml_list with string list."""
+    lines = []
+    emit_toml_list(lines, "select", ["E", "F"])
+    assert lines == ["select = [", '    "E",', '    "F",', "]"]
+
+
+def test_emit_tool_section():
+    """Test emit_tool_section appends values before subsections."""
+    lines = []
+    config = {"line-length": 100, "lint": {"select": ["E"]}}
+    emit_tool_section(lines, "ruff", config)
+    assert lines[:2] == ["[tool.ruff]", "line-length = 100"]
+    assert lines.index("[tool.ruff.lint]") > 1
+    assert lines[-1] == ""
@@ -9,16 +9,10 @@ from unittest.mock import patch
 from ci_tools.scripts.tool_config_guard import (
     _compare_tool_section,
     _find_shared_config,
-    _format_toml_list,
-    _format_toml_value,
     _handle_config_mismatch,
-    _print_toml_list,
-    _print_toml_value,
-    _print_tool_section,
     _validate_paths,
     compare_configs,
     extract_tool_config,
-    format_toml_tool_section,
     load_toml,
     main,
     print_tool_config_diff,
@@ -147,103 +141,24 @@ def test_compare_tool_section_value_mismatch():
     assert len(differences) > 0
 
 
-def test_format_toml_list_empty():
-    """Test _format_toml_list with empty list."""
-    result = _format_toml_list("key", [], "")
-    assert result == ["key = []"]
-
-
-def test_format_toml_list_strings():
-    """Test _format_toml_list with string list."""
-    result = _format_toml_list("select", ["E", "F"], "")
-    assert "select = [" in result[0]
-    assert any('"E"' in line for line in result)
-    assert any('"F"' in line for line in result)
-
-
-def test_format_toml_value_string():
-    """Test _format_toml_value with string."""
-    result = _format_toml_value("name", "test", "")
-    assert result == ['name = "test"']
-
-
-def test_format_toml_value_bool():
-    """Test _format_toml_value with boolean."""
-    result = _format_toml_value("enabled", True, "")
-    assert result == ["enabled = true"]
-    result = _format_toml_value("enabled", False, "")
-    assert result == ["enabled = false"]
-
-
-def test_format_toml_value_number():
-    """Test _format_toml_value with number."""
-    result = _format_toml_value("count", 42, "")
-    assert result == ["count = 42"]
-
-
-def test_format_toml_value_list():
-    """Test _format_toml_value with list."""
-    result = _format_toml_value("items", ["a", "b"], "")
-    assert len(result) > 0
-
-
-def test_format_toml_value_dict():
-    """Test _format_toml_value with dict returns empty."""
-    result = _format_toml_value("section", {}, "")
-    assert not result
-
-
-def test_format_toml_tool_section():
-    """Test format_toml_tool_section formats config."""
-    data = {"line-length": 100, "enabled": True}
-    result = format_toml_tool_section(data)
-    assert "line-length = 100" in result
-    assert "enabled = true" in result
-
-
-def test_format_toml_tool_section_quotes_special_keys():
-    """Keys requiring quoting should be quoted."""
-    data = {"tests/**": ["TRY002"]}
-    result = format_toml_tool_section(data)
-    assert '"tests/**"' in result
-
-
-def test_print_toml_value_string(capsys):
-    """Test _print_toml_value with string."""
-    _print_toml_value("name", "test")
-    captured = capsys.readouterr()
-    assert 'name = "test"' in captured.out
-
-
-def test_print_toml_value_bool(capsys):
-    """Test _print_toml_value with boolean."""
-    _print_toml_value("enabled", True)
-    captured = capsys.readouterr()
-    assert "enabled = true" in captured.out
-
-
-def test_print_toml_value_list(capsys):
-    """Test _print_toml_value with list."""
-    _print_toml_value("items", ["a", "b"])
-    captured = capsys.readouterr()
-    assert "items = [" in captured.out
-
-
-def test_print_toml_list_strings(capsys):
-    """Test _print_toml_list with string list."""
-    _print_toml_list("select", ["E", "F"])
-    captured = capsys.readouterr()
-    assert "select = [" in captured.out
-    assert '"E"' in captured.out
-
-
-def test_print_tool_section(capsys):
-    """Test _print_tool_section prints tool config."""
-    config = {"line-length": 100, "lint": {"select": ["E"]}}
-    _print_tool_section("ruff", config)
-    captured = capsys.readouterr()
-    assert "[tool.ruff]" in captured.out
-    assert "line-length = 100" in captured.out
+def test_compare_tool_section_reports_nested_differences_in_order():
+    """Test nested differences are reported depth-first in shared key order."""
+    shared = {"a": 1, "lint": {"select": ["E"], "ignore": ["W"]}, "z": 2}
+    repo = {"a": 1, "lint": {"select": ["F"]}, "z": 3, "extra": True}
+    differences = _compare_tool_section(shared, repo, "tool.ruff")
+    assert differences == [
+        "Configuration mismatch: [tool.ruff.lint.select] (expected: ['E'], got: ['F'])",
+        "Missing configuration: [tool.ruff.lint.ignore]",
+        "Configuration mismatch: [tool.ruff.z] (expected: 2, got: 3)",
+    ]
+
+
+def test_compare_tool_section_table_replaced_by_value():
+    """Test a shared table that the repo defines as a plain value is a mismatch."""
+    differences = _compare_tool_section({"lint": {"select": ["E"]}}, {"lint": "E"}, "tool.ruff")
+    assert differences == [
+        "Configuration mismatch: [tool.ruff.lint] (expected: {'select': ['E']}, got: E)"
+    ]
 
 
 def test_print_tool_config_diff(capsys):
@@ -10,7 +10,12 @@ from unittest.mock import patch
 import pytest
 
 from conftest import write_module
-from ci_tools.scripts import unused_module_guard
+from ci_tools.scripts import (
+    duplicate_detection,
+    guard_common,
+    import_analysis,
+    unused_module_guard,
+)
 from ci_tools.scripts.duplicate_detection import (
     SUSPICIOUS_PATTERNS,
     duplicate_reason,
@@ -22,7 +27,11 @@ from ci_tools.scripts.import_analysis import (
     collect_all_imports_with_parent,
     get_module_name,
 )
-from ci_tools.scripts.import_checking import module_is_imported
+from ci_tools.scripts.import_checking import (
+    ImportIndex,
+    check_parent_imported,
+    module_is_imported,
+)
 
 
 def test_import_collector_simple_import():
@@ -232,6 +241,12 @@ def test_duplicate_reason_false_positive():
     assert duplicate_reason("phase_2") is None
 
 
+def test_duplicate_reason_reports_first_listed_pattern():
+    """Test the reported pattern follows SUSPICIOUS_PATTERNS order, not position."""
+    assert duplicate_reason("module_2_new") == "Suspicious duplicate pattern '_new' in filename"
+    assert duplicate_reason("phase_2_old") == "Suspicious duplicate pattern '_old' in filename"
+
+
 def test_find_suspicious_duplicates(tmp_path: Path):
     """Test finding suspicious duplicate files."""
     root = tmp_path / "src"
@@ -266,60 +281,90 @@ def test_find_suspicious_duplicates_skips_pycache(tmp_path: Path):
 def test_should_skip_file_pycache():
     """Test that __pycache__ files are skipped."""
     py_file = Path("/project/src/__pycache__/module.py")
-    assert unused_module_guard.should_skip_file(py_file, []) is True
+    skip_pattern = unused_module_guard.build_skip_pattern([])
+    assert unused_module_guard.should_skip_file(py_file, skip_pattern) is True
 
 
 def test_should_skip_file_main():
     """Test that __main__.py is skipped."""
     py_file = Path("/project/src/__main__.py")
-    assert unused_module_guard.should_skip_file(py_file, []) is True
+    skip_pattern = unused_module_guard.build_skip_pattern([])
+    assert unused_module_guard.should_skip_file(py_file, skip_pattern) is True
 
 
 def test_should_skip_file_exclude_pattern():
     """Test that exclude patterns work."""
     py_file = Path("/project/src/test_module.py")
-    assert unused_module_guard.should_skip_file(py_file, ["test_"]) is True
+    assert unused_module_guard.should_skip_file(
+        py_file, unused_module_guard.build_skip_pattern(["test_"])
+    ) is True
 
 
 def test_should_skip_file_normal():
     """Test that normal files are not skipped."""
     py_file = Path("/project/src/module.py")
-    assert unused_module_guard.should_skip_file(py_file, []) is False
+    skip_pattern = unused_module_guard.build_skip_pattern([])
+    assert unused_module_guard.should_skip_file(py_file, skip_pattern) is False
+
+
+def test_build_skip_pattern_matches_literal_substrings():
+    """Test exclude patterns are matched as plain substrings, not regexes."""
+    skip_pattern = unused_module_guard.build_skip_pattern(["a.b", "[x]"])
+    assert skip_pattern.search("/src/a.b/module.py")
+    assert skip_pattern.search("/src/[x]_module.py")
+    assert not skip_pattern.search("/src/axb/module.py")
+    assert skip_pattern.search("/src/__pycache__/module.py")
 
 
 def test_module_is_imported_exact_match():
     """Test module_is_imported with exact match."""
     all_imports = {"foo", "bar.baz"}
     root = Path("src")
-    assert module_is_imported("foo", "foo", all_imports, root) is True
+    assert module_is_imported("foo", "foo", ImportIndex.build(all_imports), root) is True
 
 
 def test_module_is_imported_stem_match():
     """Test module_is_imported with stem match."""
     all_imports = {"foo", "bar"}
     root = Path("src")
-    assert module_is_imported("bar.baz", "baz", all_imports, root) is True
+    assert module_is_imported("bar.baz", "baz", ImportIndex.build(all_imports), root) is True
 
 
 def test_module_is_imported_partial_match():
     """Test module_is_imported with partial match."""
     all_imports = {"foo.bar"}
     root = Path("src")
-    assert module_is_imported("foo.bar.baz", "baz", all_imports, root) is True
+    assert module_is_imported("foo.bar.baz", "baz", ImportIndex.build(all_imports), root) is True
 
 
 def test_module_is_imported_no_match():
     """Test module_is_imported with no match."""
     all_imports = {"foo", "bar"}
     root = Path("src")
-    assert module_is_imported("qux.quux", "quux", all_imports, root) is False
+    assert module_is_imported("qux.quux", "quux", ImportIndex.build(all_imports), root) is False
+
+
+@pytest.mark.parametrize(
+    ("imports", "expected"),
+    [
+        ({"pkg"}, True),
+        ({"src.pkg.sub"}, True),
+        ({"pkg", "pkg.other"}, False),
+        ({"pkg", "pkg.sub.mod"}, True),
+        ({"pk"}, False),
+        (set(), False),
+    ],
+)
+def test_check_parent_imported(imports: set[str], expected: bool):
+    """Test wholesale parent imports cover every dotted prefix of a module."""
+    assert check_parent_imported("pkg.sub.mod", ImportIndex.build(imports)) is expected
 
 
 def test_module_is_imported_empty_name():
     """Test module_is_imported with empty name."""
     all_imports = {"foo"}
     root = Path("src")
-    assert module_is_imported("", "file", all_imports, root) is True
+    assert module_is_imported("", "file", ImportIndex.build(all_imports), root) is True
 
 
 def test_find_unused_modules(tmp_path: Path):
@@ -344,6 +389,43 @@ def test_find_unused_modules(tmp_path: Path):
     assert "unused.py" in unused_names
 
 
+def test_find_unused_modules_parses_each_file_once(tmp_path: Path):
+    """Test import collection and CLI detection share one parse per file."""
+    root = tmp_path / "src"
+    root.mkdir()
+    write_module(root / "used.py", "import os")
+    write_module(root / "unused.py", "import sys")
+    write_module(root / "main.py", "import used\nif __name__ == '__main__':\n    pass")
+
+    with patch(
+        "ci_tools.scripts.import_analysis.parse_python_ast",
+        wraps=import_analysis.parse_python_ast,
+    ) as mock_parse:
+        unused_module_guard.find_unused_modules(root, exclude_patterns=["__init__.py"])
+
+    parsed = [call.args[0] for call in mock_parse.call_args_list]
+    assert sorted(parsed) == sorted(root.glob("*.py"))
+
+
+def test_find_unused_modules_skips_parsing_files_without_imports(tmp_path: Path):
+    """Test files that cannot hold an import or main guard are never parsed."""
+    root = tmp_path / "src"
+    root.mkdir()
+    write_module(root / "used.py", "def foo(): pass")
+    write_module(root / "unused.py", "def bar(): pass")
+    write_module(root / "main.py", "import used")
+
+    with patch(
+        "ci_tools.scripts.import_analysis.parse_python_ast",
+        wraps=import_analysis.parse_python_ast,
+    ) as mock_parse:
+        result = unused_module_guard.find_unused_modules(root, exclude_patterns=["__init__.py"])
+
+    parsed = [call.args[0] for call in mock_parse.call_args_list]
+    assert parsed == [root / "main.py"]
+    assert [path.name for path, _ in result] == ["unused.py"]
+
+
 def test_find_unused_modules_excludes_init(tmp_path: Path):
     """Test that __init__.py is excluded."""
     root = tmp_path / "src"
@@ -395,6 +477,48 @@ def test_main_no_unused_modules(tmp_path: Path, capsys: pytest.CaptureFixture):
     assert "No unused modules found" in captured.out
 
 
+def test_main_walks_each_tree_once(tmp_path: Path):
+    """Test main walks the root and its parent once each and shares the results."""
+    root = tmp_path / "src"
+    root.mkdir()
+    write_module(root / "used.py", "def foo(): pass")
+    write_module(root / "module_old.py", "import used")
+
+    walked = []
+
+    def _recording_walk(path):
+        walked.append(path)
+        return guard_common.iter_python_files(path)
+
+    with patch("sys.argv", ["unused_module_guard.py", "--root", str(root)]), patch.object(
+        unused_module_guard, "iter_python_files", _recording_walk
+    ), patch.object(import_analysis, "iter_python_files", _recording_walk), patch.object(
+        duplicate_detection, "iter_python_files", _recording_walk
+    ):
+        unused_module_guard.main()
+
+    assert walked == [root, tmp_path]
+
+
+def test_main_reports_unused_modules_under_symlinked_root(
+    tmp_path: Path, capsys: pytest.CaptureFixture
+):
+    """Test a symlinked root is walked even though the parent walk skips it."""
+    real = tmp_path / "real"
+    real.mkdir()
+    write_module(real / "orphan.py", "def bar(): pass")
+    root = tmp_path / "proj" / "src"
+    root.parent.mkdir()
+    root.symlink_to(Path("..") / "real", target_is_directory=True)
+
+    with patch("sys.argv", ["unused_module_guard.py", "--root", str(root)]):
+        result = unused_module_guard.main()
+
+    assert result == 1
+    captured = capsys.readouterr()
+    assert "orphan.py: Never imported" in captured.out
+
+
 def test_main_detects_unused_modules(tmp_path: Path, capsys: pytest.CaptureFixture):
     """Test main function detects unused modules."""
     root = tmp_path / "src"
@@ -488,6 +612,20 @@ def test_main_custom_exclude_patterns(tmp_path: Path):
     assert result == 0
 
 
+def test_report_results_orders_entries_like_paths(tmp_path: Path, capsys: pytest.CaptureFixture):
+    """Test report ordering follows path components, not the raw path string."""
+    root = tmp_path
+    unused = [
+        (root / "a-b" / "x.py", "never imported"),
+        (root / "a" / "x.py", "never imported"),
+    ]
+
+    assert unused_module_guard.report_results(unused, [], root, strict=False)
+
+    output = capsys.readouterr().out
+    assert output.index(str(Path("a") / "x.py")) < output.index(str(Path("a-b") / "x.py"))
+
+
 def test_find_unused_modules_nested_packages(tmp_path: Path):
     """Test finding unused modules in nested packages."""
     root = tmp_path / "src"
@@ -587,8 +725,29 @@ def test_module_is_imported_with_partial_paths():
     root = Path("src")
 
     # Should match any partial path
-    assert module_is_imported("foo.bar.baz.qux", "qux", all_imports, root) is True
-    assert module_is_imported("foo.bar", "bar", all_imports, root) is True
+    index = ImportIndex.build(all_imports)
+    assert module_is_imported("foo.bar.baz.qux", "qux", index, root) is True
+    assert module_is_imported("foo.bar", "bar", ImportIndex.build(all_imports), root) is True
+
+
+def test_import_index_counts_descendants():
+    """Test ImportIndex counts each import under every dotted prefix."""
+    index = ImportIndex.build(["pkg", "pkg.a", "pkg.a.b", "pkg.c", "other"])
+    assert index.descendant_counts["pkg"] == 3
+    assert index.descendant_counts["pkg.a"] == 1
+    assert index.descendant_counts["other"] == 0
+    assert index.names == frozenset({"pkg", "pkg.a", "pkg.a.b", "pkg.c", "other"})
+
+
+def test_module_is_imported_parent_with_sibling_imports():
+    """Test a wholesale parent import does not cover a module when siblings are named."""
+    root = Path("src")
+    sibling_named = ImportIndex.build({"pkg", "pkg.other"})
+    assert module_is_imported("pkg.mod", "mod", sibling_named, root) is False
+    only_parent = ImportIndex.build({"pkg"})
+    assert module_is_imported("pkg.mod", "mod", only_parent, root) is True
+    child_of_module = ImportIndex.build({"src.pkg.mod.inner"})
+    assert module_is_imported("pkg.mod", "unrelated", child_of_module, root) is True
 
 
 def test_load_whitelist_empty(tmp_path: Path):
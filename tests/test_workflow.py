@@ -359,7 +359,7 @@ class TestStageIfNeeded:
         result = _stage_if_needed(options, "old staged diff")
 
         assert result == "new staged diff"
-        mock_run.assert_called_once_with(["git", "add", "-A"], check=True)
+        mock_run.assert_called_once_with(["git", "add", "-A"], check=True, capture_output=False)
 
     def test_returns_existing_staged_diff_when_disabled(self):
         """Test returning existing diff when auto-stage is disabled."""